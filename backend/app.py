@@ -1,17 +1,31 @@
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from pydantic import BaseModel, HttpUrl, constr
+from pydantic import BaseModel, HttpUrl, constr, conlist
 from urllib.parse import urlparse
 from backend.scrapers import DOMAIN_SCRAPER
-from backend.relevance import filter_results
+from backend.scrapers.browser import BrowserPool
+from backend.scrapers.http_client import HttpClient
+from backend.cache import create_cache
+from backend.catalog import Catalog
+from backend.singleflight import SingleFlight
+from backend.refresher import Refresher
+from backend.scheduler import ScrapeScheduler
+from backend.workers import CpuExecutor
+from backend.profiling import RequestProfiler
+from backend import metrics, tracing
+from backend.search import cheapest_in_catalog, refresh_retailer, search_retailer, search_retailers, stream_retailers, summarize
 import os
+import secrets
+import json
+import orjson
 from pathlib import Path
 from dotenv import load_dotenv
+from contextlib import asynccontextmanager
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -20,18 +34,176 @@ load_dotenv()
 
 ENV = os.getenv(key="ENV", default="development")
 RATE_LIMIT_PER_MINUTE = os.getenv(key="RATE_LIMIT_PER_MINUTE", default=11)
+# one /search call covers every retailer, so it gets its own (lower) limit
+SEARCH_RATE_LIMIT_PER_MINUTE = os.getenv(
+    key="SEARCH_RATE_LIMIT_PER_MINUTE", default="3")
+# per-retailer timeout for /search, so the slowest retailer can't hold the response forever
+RETAILER_TIMEOUT_SECONDS = float(
+    os.getenv(key="RETAILER_TIMEOUT_SECONDS", default=30))
+
+# shared Chromium pool (number of warm browsers, max open pages, pages before a browser is recycled)
+BROWSER_POOL_SIZE = int(os.getenv(key="BROWSER_POOL_SIZE", default=1))
+BROWSER_MAX_PAGES = int(os.getenv(key="BROWSER_MAX_PAGES", default=4))
+BROWSER_MAX_USES = int(os.getenv(key="BROWSER_MAX_USES", default=100))
+
+# scrape admission control: concurrent scrapes per retailer, queued scrapes, max time in the queue
+# (the global browser page limit is BROWSER_MAX_PAGES)
+SCRAPE_MAX_PER_DOMAIN = int(os.getenv(key="SCRAPE_MAX_PER_DOMAIN", default=2))
+SCRAPE_MAX_QUEUE = int(os.getenv(key="SCRAPE_MAX_QUEUE", default=32))
+SCRAPE_MAX_WAIT_SECONDS = float(
+    os.getenv(key="SCRAPE_MAX_WAIT_SECONDS", default=30))
+
+# shared HTTP client for the browser-free scrapers (total and per-retailer connections)
+HTTP_MAX_CONNECTIONS = int(os.getenv(key="HTTP_MAX_CONNECTIONS", default=50))
+HTTP_MAX_PER_HOST = int(os.getenv(key="HTTP_MAX_PER_HOST", default=6))
+
+# scrape result cache per (retailer, normalized term): "memory" or "sqlite" (survives restarts)
+CACHE_BACKEND = os.getenv(key="CACHE_BACKEND", default="memory")
+CACHE_TTL_SECONDS = float(os.getenv(key="CACHE_TTL_SECONDS", default=900))
+CACHE_MAX_ENTRIES = int(os.getenv(key="CACHE_MAX_ENTRIES", default=1000))
+CACHE_PATH = os.getenv(key="CACHE_PATH", default=str(BASE_DIR / "cache.sqlite3"))
+# how long past the TTL a stale entry may still be served while it's refreshed
+CACHE_STALE_SECONDS = float(os.getenv(key="CACHE_STALE_SECONDS", default=3600))
+# every scraped product, indexed by model number (answers /cheapest without scraping while fresh)
+CATALOG_PATH = os.getenv(key="CATALOG_PATH", default=str(BASE_DIR / "catalog.sqlite3"))
+CATALOG_MAX_AGE_SECONDS = float(
+    os.getenv(key="CATALOG_MAX_AGE_SECONDS", default=21600))
+
+# background refresh of popular searches (seconds between rounds, hottest pairs kept warm)
+REFRESH_INTERVAL_SECONDS = float(
+    os.getenv(key="REFRESH_INTERVAL_SECONDS", default=60))
+REFRESH_TOP_K = int(os.getenv(key="REFRESH_TOP_K", default=50))
+REFRESH_CONCURRENCY = int(os.getenv(key="REFRESH_CONCURRENCY", default=2))
+# keep every model from static/models.json warm for every retailer
+REFRESH_SEED_MODELS = os.getenv(
+    key="REFRESH_SEED_MODELS", default="true").lower() == "true"
+
+# pool for CPU-bound work (HTML parsing, relevance scoring): thread, process or inline
+CPU_EXECUTOR = os.getenv(key="CPU_EXECUTOR", default="thread")
+CPU_WORKERS = int(os.getenv(key="CPU_WORKERS", default=os.cpu_count() or 1))
+
+# best matches returned per retailer (-1 = all, 0 = starting price only); starting_from always covers every match
+RESULT_TOP_K = int(os.getenv(key="RESULT_TOP_K", default=10))
+
+# OpenTelemetry traces per request: "otlp" (OTEL_EXPORTER_OTLP_ENDPOINT), "file" or "" (off)
+TRACING_EXPORTER = os.getenv(key="TRACING_EXPORTER", default="")
+TRACING_FILE = os.getenv(key="TRACING_FILE", default=str(BASE_DIR / "traces.jsonl"))
+
+# admin-only request profiling (X-Profile: 1 + X-Admin-Token), off while ADMIN_TOKEN is empty
+ADMIN_TOKEN = os.getenv(key="ADMIN_TOKEN", default="")
+PROFILE_DIR = os.getenv(key="PROFILE_DIR", default=str(BASE_DIR / "profiles"))
+PROFILE_MAX_CONCURRENT = int(os.getenv(key="PROFILE_MAX_CONCURRENT", default=1))
 
 
 ALLOWED_DOMAINS = set(DOMAIN_SCRAPER.keys())
 
 # rate limiter
 limiter = Limiter(key_func=get_remote_address)
-app = FastAPI(title="Retailer Price Scraper")
+
+
+def load_models() -> list[str]:
+    """Curated model list used for the search suggestions."""
+    with open(BASE_DIR / "static" / "models.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tracing.setup(TRACING_EXPORTER, TRACING_FILE)
+
+    # start the warm browsers once for the whole process
+    browser_pool = BrowserPool(
+        size=BROWSER_POOL_SIZE,
+        max_pages=BROWSER_MAX_PAGES,
+        max_uses=BROWSER_MAX_USES,
+    )
+    await browser_pool.start()
+    app.state.browser_pool = browser_pool
+    metrics.track_browser_pool(browser_pool)
+
+    # one pooled HTTP client so the HTTP scrapers reuse connections
+    http_client = HttpClient(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        per_host=HTTP_MAX_PER_HOST,
+    )
+    await http_client.start()
+    app.state.http_client = http_client
+
+    # parsing and scoring run here instead of on the event loop
+    executor = CpuExecutor(kind=CPU_EXECUTOR, workers=CPU_WORKERS)
+    executor.start()
+    app.state.executor = executor
+    app.state.result_top_k = RESULT_TOP_K if RESULT_TOP_K >= 0 else None
+
+    # bounds browser pages and per-retailer scrapes, rejects when overloaded
+    app.state.scheduler = ScrapeScheduler(
+        browser_slots=BROWSER_MAX_PAGES,
+        per_domain=SCRAPE_MAX_PER_DOMAIN,
+        max_queue=SCRAPE_MAX_QUEUE,
+        max_wait=SCRAPE_MAX_WAIT_SECONDS,
+    )
+    metrics.track_scheduler(app.state.scheduler)
+
+    app.state.cache = create_cache(
+        CACHE_BACKEND,
+        ttl=CACHE_TTL_SECONDS,
+        max_entries=CACHE_MAX_ENTRIES,
+        path=CACHE_PATH,
+        stale_ttl=CACHE_STALE_SECONDS,
+    )
+
+    app.state.catalog = Catalog(CATALOG_PATH, max_age=CATALOG_MAX_AGE_SECONDS)
+
+    # concurrent identical (domain, normalized term) scrapes share one run
+    app.state.scrapes = SingleFlight()
+
+    # keep popular searches warm
+    refresher = Refresher(
+        lambda domain, term: refresh_retailer(app.state, domain, term),
+        app.state.cache,
+        interval=REFRESH_INTERVAL_SECONDS,
+        top_k=REFRESH_TOP_K,
+        concurrency=REFRESH_CONCURRENCY,
+    )
+    if REFRESH_SEED_MODELS:
+        for term in load_models():
+            for domain in DOMAIN_SCRAPER:
+                refresher.pin(domain, term)
+    await refresher.start()
+    app.state.refresher = refresher
+
+    yield
+
+    await refresher.stop()
+
+    await app.state.cache.close()
+    await app.state.catalog.close()
+    await http_client.stop()
+    await browser_pool.stop()
+    executor.stop()
+    tracing.shutdown()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson, which handles the Product dataclasses
+    natively (FastAPI's own ORJSONResponse is deprecated).
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(title="Retailer Price Scraper", lifespan=lifespan,
+              default_response_class=FastJSONResponse)
 app.state.limiter = limiter
 
+request_profiler = RequestProfiler(PROFILE_DIR, max_concurrent=PROFILE_MAX_CONCURRENT)
+
 
 class SearchRequest(BaseModel):
     """Define request model with Pydantic"""
+    # retailer URL (only its domain is used, the search URL is built from the term)
     url: HttpUrl
     term: constr(
         strip_whitespace=True,
@@ -40,72 +212,193 @@ class SearchRequest(BaseModel):
     )  # type: ignore
 
 
+class MultiSearchRequest(BaseModel):
+    """Request model for searching several retailers at once"""
+    term: constr(
+        strip_whitespace=True,
+        min_length=1,
+        max_length=100
+    )  # type: ignore
+    # retailer domains, as keys of DOMAIN_SCRAPER
+    retailers: conlist(
+        str,
+        min_length=1,
+        max_length=len(DOMAIN_SCRAPER)
+    )  # type: ignore
+
+
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+    metrics.RATE_LIMITED.labels(request.url.path).inc()
     return JSONResponse(
         status_code=429,
         content={"detail": "Too many requests"}
     )
 
 
+def wants_profile(request: Request) -> bool:
+    """X-Profile: 1 with the admin token (constant-time comparison)."""
+    if not ADMIN_TOKEN or request.headers.get("X-Profile") != "1":
+        return False
+    # as bytes: compare_digest rejects str with non-ASCII characters
+    return secrets.compare_digest(
+        request.headers.get("X-Admin-Token", "").encode(), ADMIN_TOKEN.encode())
+
+
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """
+    Run an admin's request under the profiler and save a speedscope file
+    named after the X-Request-ID returned. Profiling stops once the response
+    starts, so a stream's body (/search/stream) isn't covered.
+    """
+    if not wants_profile(request):
+        return await call_next(request)
+
+    async with request_profiler.profile() as request_id:
+        response = await call_next(request)
+
+    if request_id is None:
+        # already profiling as many requests as allowed
+        response.headers["X-Profile"] = "busy"
+    else:
+        response.headers["X-Profile"] = "saved"
+        response.headers["X-Request-ID"] = request_id
+    return response
+
+
 @app.post("/extract-price")
 # 3 searches * 11 retailers per minute
 @limiter.limit(RATE_LIMIT_PER_MINUTE+"/minute")
 async def search_products(request: Request):
-    body = await request.json()
-    search_req = SearchRequest(**body)
+    # one trace per request (no-op unless TRACING_EXPORTER is set)
+    with tracing.span("POST /extract-price"):
+        with tracing.span("validation"):
+            body = await request.json()
+            search_req = SearchRequest(**body)
+
+            # parse the URL and check that it's not file://, ftp://, etc.
+            parsed_url = urlparse(str(search_req.url))
+
+            if parsed_url.scheme not in ("http", "https"):
+                raise HTTPException(status_code=400, detail="Invalid URL scheme")
+
+            # Extract domain from the URL
+            domain = parsed_url.netloc.replace("www.", "")
 
-    # parse the URL and check that it's not file://, ftp://, etc.
-    parsed_url = urlparse(str(search_req.url))
+            # check that the requested domain is in allowed retailer domains (to prevent SSRF)
+            if domain not in ALLOWED_DOMAINS:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Domain not allowed"
+                )
 
-    if parsed_url.scheme not in ("http", "https"):
-        raise HTTPException(status_code=400, detail="Invalid URL scheme")
+        # the URL only picks the retailer: its search page is built from the term on the
+        # server, so a client can't get another page's products cached under the term
+        with tracing.span("dispatch", domain=domain, term=search_req.term):
+            result = await search_retailer(request.app.state, domain, search_req.term)
 
-    # Extract domain from the URL
-    domain = parsed_url.netloc.replace("www.", "")
+    # report cache status and stage timings in headers, not the body
+    cache_status = result.pop("cache")
+    timings = result.pop("timings")
+    server_timing = ", ".join(
+        f"{stage};dur={t * 1000:.1f}" for stage, t in timings.items())
 
-    # check that the requested domain is in allowed retailer domains (to prevent SSRF)
-    if domain not in ALLOWED_DOMAINS:
+    return FastJSONResponse(result, headers={
+        "X-Cache": cache_status.upper(),
+        "Server-Timing": server_timing,
+    })
+
+
+def requested_domains(search_req: MultiSearchRequest) -> list[str]:
+    """Validate the requested retailer domains and drop duplicates (keeping order)."""
+    # check that every requested domain is in allowed retailer domains
+    unknown = [d for d in search_req.retailers if d not in ALLOWED_DOMAINS]
+    if unknown:
         raise HTTPException(
             status_code=400,
-            detail="Domain not allowed"
+            detail=f"Domain not allowed: {', '.join(unknown)}"
         )
 
-    # Lookup scraper class for this domain
-    scraper_class = DOMAIN_SCRAPER.get(domain)
-    if not scraper_class:
-        # If no scraper exists for this domain, return 400 error
-        raise HTTPException(
-            status_code=400, detail=f"No scraper available for domain '{domain}'")
+    return list(dict.fromkeys(search_req.retailers))
 
-    # Instantiate scraper
-    scraper = scraper_class()
 
-    try:
-        # Call the scraper to get products
-        # Convert request.url to string before passing, because scrapers usually expect strings
-        products = await scraper.scrape(str(search_req.url), search_req.term)
-    except Exception as e:
-        # Catch any scraping errors and return 500
-        raise HTTPException(
-            status_code=500, detail=f"Scraping failed: {str(e)}")
+@app.post("/search")
+@limiter.limit(SEARCH_RATE_LIMIT_PER_MINUTE+"/minute")
+async def search_all_retailers(request: Request, search_req: MultiSearchRequest):
+    """Search several retailers for one term and return all results in one response."""
+    domains = requested_domains(search_req)
 
-    if not products:
-        # If scraper returns empty list, return 404
-        raise HTTPException(status_code=404, detail="No products found")
+    results = await search_retailers(
+        request.app.state, domains, search_req.term, timeout=RETAILER_TIMEOUT_SECONDS)
 
-    # filter results and remove the unrelated ones
-    filtered_products = filter_results(search_req.term, products)
+    cache_hits = sum(1 for r in results if r.get("cache") in ("hit", "stale"))
+
+    return FastJSONResponse(
+        {"term": search_req.term, "results": results,
+            "summary": summarize(results)},
+        headers={"X-Cache-Hits": f"{cache_hits}/{len(results)}"},
+    )
+
+
+@app.post("/search/stream")
+@limiter.limit(SEARCH_RATE_LIMIT_PER_MINUTE+"/minute")
+async def stream_all_retailers(request: Request, search_req: MultiSearchRequest):
+    """
+    Same as /search, but streams newline-delimited JSON: one "result" event
+    per retailer as soon as it finishes, then a "summary" event.
+    """
+    domains = requested_domains(search_req)
+
+    async def events():
+        async for event in stream_retailers(
+                request.app.state, domains, search_req.term, timeout=RETAILER_TIMEOUT_SECONDS):
+            yield orjson.dumps(event) + b"\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="application/x-ndjson",
+        # stop proxies (nginx) from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/cheapest")
+@limiter.limit(SEARCH_RATE_LIMIT_PER_MINUTE+"/minute")
+async def cheapest(request: Request, term: str = Query(min_length=1, max_length=100)):
+    """
+    Cheapest listing of a model (e.g. GA-2100) across all retailers, from the
+    product catalog; only retailers with stale catalog data are scraped.
+    """
+    return await cheapest_in_catalog(
+        request.app.state, term.strip(), timeout=RETAILER_TIMEOUT_SECONDS)
+
+
+@app.get("/stats")
+async def stats(request: Request):
+    """Counters for scrape scheduling, in-flight deduplication, the CPU executor and background refresh."""
+    refresher = request.app.state.refresher
+    return {
+        "scheduler": request.app.state.scheduler.stats(),
+        "scrapes": request.app.state.scrapes.stats(),
+        "executor": {
+            "kind": request.app.state.executor.kind,
+            "workers": request.app.state.executor.workers,
+        },
+        "refresher": {
+            "tracked": len(refresher.popularity),
+            "pinned": len(refresher.pinned),
+            "refreshing": refresher.refreshing,
+        },
+    }
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Prometheus metrics: per-retailer stage histograms, products, cache, browser pool and rate limiting."""
+    body, content_type = metrics.latest()
+    return Response(body, media_type=content_type)
 
-    if filtered_products:
-        # Find the product with the minimum price
-        min_product = min(filtered_products, key=lambda x: x["price"])
-        # Return the scraped products as JSON
-        return {"filtered_products":  filtered_products, "starting_from": min_product["price"]}
-    else:
-        # If filtered products is empty, return all products
-        min_product = min(products, key=lambda x: x["price"])
-        return {"all_products":  products, "starting_from": min_product["price"]}
 
 # Serve frontend last
 app.mount("/", StaticFiles(directory=BASE_DIR /
@@ -0,0 +1,181 @@
+"""
+Relevance scoring benchmark.
+
+Scores synthetic listings (built from static/models.json) for every model
+query, once per product with the original relevance_score (frozen in
+relevance_reference: the query is analysed again for each product), once
+per batch with CompiledQuery and, when numpy is installed, as matrix
+operations with BatchScorer (bulk sweeps: use --terms for hundreds of
+search terms). Every path is first checked against the reference.
+
+    python -m backend.benchmarks.bench_relevance [--listings 600] [--terms 20] [--rounds 5]
+"""
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from backend.benchmarks import relevance_reference as reference
+from backend.product import Product
+from backend.relevance import CompiledQuery, filter_results, relevance_score
+from backend.relevance_batch import BatchScorer, filter_results_many, np
+
+MODELS_PATH = Path(__file__).resolve().parent.parent / "static" / "models.json"
+
+# title pieces seen on retailer result pages
+BRANDS = ["Casio", "G-Shock", "Casio G-Shock", "Seiko", "Citizen"]
+SUFFIXES = ["-1A", "-1A1ER", "-4A", "-9AER", "MB-1", "", ""]
+EXTRAS = [
+    "Men's Watch", "Digital Analog", "Black Resin Strap", "Solar", "200M",
+    "Limited Edition", "Carbon Core Guard", "Quartz Watch", "Stainless Steel",
+]
+ACCESSORIES = [
+    "Replacement Band for {model}", "Strap fits {model}", "Bumper Guard compatible with {model}",
+    "Nylon NATO Strap {model}", "Screen Protector for {model}",
+]
+
+
+def load_queries() -> list[str]:
+    with open(MODELS_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_terms(queries: list[str], count: int, seed: int = 0) -> list[str]:
+    """The model queries, plus variants of them (brand, suffix) up to count terms."""
+    rng = random.Random(seed)
+    terms = queries[:count]
+
+    while len(terms) < count:
+        model = rng.choice(queries).split()[-1]
+        terms.append(f"{rng.choice(BRANDS)} {model}{rng.choice(SUFFIXES)}")
+
+    return terms
+
+
+def make_listings(queries: list[str], count: int, seed: int = 0) -> list[Product]:
+    """Listings mixing exact models, variants, other families and accessories."""
+    rng = random.Random(seed)
+    listings = []
+
+    for i in range(count):
+        model = rng.choice(queries).split()[-1]
+        kind = rng.random()
+
+        if kind < 0.2:
+            name = rng.choice(ACCESSORIES).format(model=model)
+        else:
+            extras = " ".join(rng.sample(EXTRAS, rng.randint(1, 3)))
+            name = f"{rng.choice(BRANDS)} {model}{rng.choice(SUFFIXES)} {extras}"
+
+        listings.append(Product(name=name, price=round(rng.uniform(40, 900), 2)))
+
+    return listings
+
+
+class ParityError(Exception):
+    """A scoring path disagrees with the reference implementation."""
+
+
+def check_parity(queries: list[str], listings: list[Product]):
+    """
+    Compare the scoring paths with the frozen reference: same scores, same
+    thresholds, same filtered products in the same order, for CompiledQuery
+    and (when numpy is installed) BatchScorer / filter_results_many. Raises
+    ParityError on the first difference.
+    """
+    names = [listing.name for listing in listings]
+    records = [listing.to_dict() for listing in listings]
+    if np is not None:
+        batch_scores = BatchScorer(names).scores(queries).tolist()
+        batch_filtered = filter_results_many(queries, listings)
+
+    for row, query in enumerate(queries):
+        expected = [reference.relevance_score(query, name) for name in names]
+        threshold = reference.recommended_threshold(query)
+        filtered = [(r["name"], r["price"], r["score"])
+                    for r in reference.filter_results(query, records)]
+
+        compiled = CompiledQuery(query)
+        if compiled.threshold != threshold:
+            raise ParityError(f"{query!r}: threshold {compiled.threshold} != {threshold}")
+        if compiled.score_all(names) != expected:
+            raise ParityError(f"{query!r}: CompiledQuery scores differ")
+        if [relevance_score(query, name) for name in names] != expected:
+            raise ParityError(f"{query!r}: relevance_score differs")
+        if [(p.name, p.price, p.score) for p in filter_results(query, listings)] != filtered:
+            raise ParityError(f"{query!r}: filter_results kept or ordered products differently")
+
+        if np is None:
+            continue
+        if batch_scores[row] != expected:
+            raise ParityError(f"{query!r}: BatchScorer scores differ")
+        if [(p.name, p.price, p.score) for p in batch_filtered[row]] != filtered:
+            raise ParityError(f"{query!r}: filter_results_many kept or ordered products differently")
+
+
+def best_of(rounds: int, fn) -> float:
+    """Fastest of a few runs, in seconds."""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--listings", type=int, default=600)
+    parser.add_argument("--terms", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--check", action="store_true",
+                        help="only check every path against the reference, no timings")
+    args = parser.parse_args()
+
+    models = load_queries()
+    queries = make_terms(models, args.terms)
+    listings = make_listings(models, args.listings)
+    names = [listing.name for listing in listings]
+
+    def per_product():
+        for query in queries:
+            [reference.relevance_score(query, name) for name in names]
+
+    def compiled():
+        for query in queries:
+            CompiledQuery(query).score_all(names)
+
+    def filtered():
+        for query in queries:
+            filter_results(query, listings)
+
+    def batch():
+        BatchScorer(names).scores(queries)
+
+    # all paths must agree before their speed is worth comparing
+    check_parity(queries, listings)
+    if args.check:
+        print(f"{len(queries)} queries x {len(names)} listings: every scoring path matches the reference")
+        return
+
+    scored = len(queries) * len(names)
+    print(f"{len(queries)} queries x {len(names)} listings = {scored} scores")
+
+    results = {
+        "original relevance_score": best_of(args.rounds, per_product),
+        "CompiledQuery.score_all": best_of(args.rounds, compiled),
+        "filter_results": best_of(args.rounds, filtered),
+    }
+    if np is not None:
+        results["BatchScorer.scores"] = best_of(args.rounds, batch)
+        results["filter_results_many"] = best_of(
+            args.rounds, lambda: filter_results_many(queries, listings))
+    baseline = results["original relevance_score"]
+
+    for name, seconds in results.items():
+        print(f"{name:<30} {seconds * 1000:8.1f} ms  "
+              f"{scored / seconds:10.0f} scores/s  x{baseline / seconds:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Offline scraper benchmark.
+
+Serves the recorded fixtures (see backend.benchmarks.record) from a local
+stand-in server and runs each retailer's scraper against it, measuring
+end-to-end latency, time per stage (fetch / navigation / readiness /
+extraction / parse), filter_results throughput on the scraped products and
+peak RSS (this process and its children, such as Chromium). Results
+are written to a JSON report; --compare flags regressions against an
+earlier one.
+
+    python -m backend.benchmarks.bench_scrapers [--rounds 5] [--report report.json] [--compare baseline.json]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from backend.benchmarks.fixtures import FIXTURES_DIR, load_index
+from backend.benchmarks.processes import RssSampler
+from backend.benchmarks.standin import StandIn
+from backend.relevance import CompiledQuery
+from backend.scrapers import DOMAIN_SCRAPER
+from backend.scrapers.browser import BrowserPool
+from backend.scrapers.http_client import HttpClient
+from backend.scrapers.origins import set_overrides
+from backend.scrapers.parsing import parser as html_parser
+from backend.workers import CpuExecutor
+
+# relative slowdown of a median before it counts as a regression
+DEFAULT_TOLERANCE = 0.10
+
+
+def summary_ms(samples: list[float]) -> dict:
+    return {
+        "median": round(statistics.median(samples) * 1000, 2),
+        "min": round(min(samples) * 1000, 2),
+        "max": round(max(samples) * 1000, 2),
+    }
+
+
+def relevance_throughput(term: str, products: list, min_seconds: float = 0.2) -> float:
+    """Products scored and filtered per second (repeats until min_seconds)."""
+    if not products:
+        return 0.0
+
+    scored = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < min_seconds:
+        CompiledQuery(term).matches(products)
+        scored += len(products)
+    return round(scored / (time.perf_counter() - started))
+
+
+async def bench_fixture(fixture: dict, rounds: int, browser_pool, http_client, executor) -> dict:
+    scraper_class = DOMAIN_SCRAPER[fixture["domain"]]
+    latencies, stages, errors = [], {}, []
+    products = []
+
+    with RssSampler() as rss:
+        for _ in range(rounds):
+            scraper = scraper_class(
+                browser_pool=browser_pool, http_client=http_client, executor=executor)
+            started = time.perf_counter()
+            try:
+                products = await scraper.scrape(fixture["url"], fixture["term"])
+            except Exception as e:
+                errors.append(str(e))
+                continue
+            latencies.append(time.perf_counter() - started)
+
+            for stage, seconds in scraper.timings.items():
+                stages.setdefault(stage, []).append(seconds)
+
+    result = {
+        "term": fixture["term"],
+        "rounds": rounds,
+        "errors": len(errors),
+        "products": len(products),
+        "matches": len(CompiledQuery(fixture["term"]).matches(products)),
+        "relevance_products_per_second": relevance_throughput(fixture["term"], products),
+        "peak_rss_mb": round(rss.peak_mb, 1),
+    }
+    if latencies:
+        result["latency_ms"] = summary_ms(latencies)
+        result["stages_ms"] = {stage: summary_ms(s)["median"] for stage, s in stages.items()}
+    if errors:
+        result["last_error"] = errors[-1]
+    return result
+
+
+async def run(fixtures: list[dict], fixtures_dir: Path, rounds: int, use_browser: bool) -> dict:
+    stand_in = StandIn([fixtures_dir / f["har"] for f in fixtures])
+    set_overrides(stand_in.start())
+
+    http_client = HttpClient()
+    await http_client.start()
+    browser_pool = None
+    if use_browser:
+        browser_pool = BrowserPool(size=1, max_pages=1)
+        await browser_pool.start()
+    # inline, so parse times are the parser's own (no pool hand-off)
+    executor = CpuExecutor("inline")
+
+    results = {}
+    try:
+        for fixture in fixtures:
+            key = f"{fixture['domain']}|{fixture['term']}"
+            results[key] = await bench_fixture(
+                fixture, rounds, browser_pool, http_client, executor)
+            latency = results[key].get("latency_ms", {}).get("median")
+            print(f"{key:<40} {latency if latency is not None else '-':>10} ms  "
+                  f"{results[key]['products']:>4} products  {results[key]['errors']} errors")
+    finally:
+        await http_client.stop()
+        if browser_pool:
+            await browser_pool.stop()
+        stand_in.stop()
+        set_overrides({})
+
+    return {
+        "meta": {
+            "created": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "html_parser": html_parser.name,
+            "rounds": rounds,
+        },
+        "scrapers": results,
+        "peak_rss_mb": max((r["peak_rss_mb"] for r in results.values()), default=0),
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Median latency / stage times that got slower than the tolerance allows."""
+    regressions = []
+
+    for key, result in report["scrapers"].items():
+        before = baseline.get("scrapers", {}).get(key)
+        if not before or "latency_ms" not in before or "latency_ms" not in result:
+            continue
+
+        metrics = {"latency": (before["latency_ms"]["median"], result["latency_ms"]["median"])}
+        for stage, ms in result.get("stages_ms", {}).items():
+            if stage in before.get("stages_ms", {}):
+                metrics[stage] = (before["stages_ms"][stage], ms)
+
+        for metric, (old, new) in metrics.items():
+            if old > 0 and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{key} {metric}: {old:.2f} -> {new:.2f} ms (+{(new / old - 1) * 100:.0f}%)")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--domains", nargs="+", help="only these retailers")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--no-browser", action="store_true",
+                        help="skip the Playwright retailers")
+    parser.add_argument("--report", type=Path, default=Path("benchmark-report.json"))
+    parser.add_argument("--compare", type=Path, help="earlier report to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    fixtures = [
+        f for f in load_index(args.fixtures)
+        if f["domain"] in DOMAIN_SCRAPER
+        and (not args.domains or f["domain"] in args.domains)
+        and not (args.no_browser and DOMAIN_SCRAPER[f["domain"]].uses_browser)
+    ]
+    if not fixtures:
+        sys.exit(f"No fixtures in {args.fixtures}, record some with: python -m backend.benchmarks.record")
+
+    report = asyncio.run(run(fixtures, args.fixtures, args.rounds, not args.no_browser))
+
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"peak RSS {report['peak_rss_mb']} MB, report written to {args.report}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
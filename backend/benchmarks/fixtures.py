@@ -0,0 +1,97 @@
+"""
+Recorded retailer fixtures for the offline benchmarks.
+
+Each (retailer, term) fixture is a HAR file holding every response its
+scraper needed: the HTTP scrapers' requests (recorded by
+RecordingHttpClient) and, for Playwright retailers, the browser's own HAR.
+fixtures/index.json lists them.
+"""
+import json
+import time
+from pathlib import Path
+import httpx
+from backend.relevance import normalize
+from backend.scrapers.http_client import HttpClient
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+INDEX_NAME = "index.json"
+
+
+def slug(term: str) -> str:
+    return normalize(term).replace(" ", "-") or "empty"
+
+
+def har_entry(url: str, resp: httpx.Response) -> dict:
+    """Minimal HAR entry for an httpx response (decoded body)."""
+    return {
+        "request": {"method": resp.request.method, "url": url},
+        "response": {
+            "status": resp.status_code,
+            "headers": [],
+            "content": {
+                "mimeType": resp.headers.get("content-type", "text/html"),
+                "text": resp.text,
+            },
+            "redirectURL": "",
+        },
+    }
+
+
+def read_har(path: Path) -> list[dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["log"]["entries"]
+
+
+def write_har(path: Path, entries: list[dict]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"log": {
+            "version": "1.2",
+            "creator": {"name": "watch-scraper benchmarks", "version": "1"},
+            "entries": entries,
+        }}, f)
+
+
+def load_index(fixtures_dir: Path = FIXTURES_DIR) -> list[dict]:
+    """[{"domain", "term", "url", "har", "recorded_at"}, ...]"""
+    path = fixtures_dir / INDEX_NAME
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["fixtures"]
+
+
+def save_fixture(fixtures_dir: Path, domain: str, term: str, url: str, entries: list[dict]):
+    """Write a fixture's HAR and (re)place it in the index."""
+    har = Path(domain) / f"{slug(term)}.har"
+    write_har(fixtures_dir / har, entries)
+
+    index = [
+        f for f in load_index(fixtures_dir)
+        if not (f["domain"] == domain and slug(f["term"]) == slug(term))
+    ]
+    index.append({
+        "domain": domain,
+        "term": term,
+        "url": url,
+        "har": har.as_posix(),
+        "recorded_at": time.time(),
+    })
+
+    with open(fixtures_dir / INDEX_NAME, "w", encoding="utf-8") as f:
+        json.dump({"fixtures": index}, f, indent=2)
+
+
+class RecordingHttpClient(HttpClient):
+    """HttpClient that keeps a HAR entry of every response it returns."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.entries: list[dict] = []
+
+    async def get(self, url: str, headers: dict | None = None, timeout: float = 15, **kwargs) -> httpx.Response:
+        resp = await super().get(url, headers=headers, timeout=timeout, **kwargs)
+        # stored under the URL that was asked for (the stand-in doesn't redirect)
+        requested = resp.history[0].request.url if resp.history else resp.request.url
+        self.entries.append(har_entry(str(requested), resp))
+        return resp
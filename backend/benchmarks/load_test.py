@@ -0,0 +1,281 @@
+"""
+Load test for /extract-price.
+
+Serves the recorded fixtures (see backend.benchmarks.record) from the local
+stand-in server, starts the app under uvicorn in a subprocess pointed at
+it (ORIGIN_OVERRIDES), and drives it with concurrent searches: random
+terms from static/models.json on random recorded retailers. Every term of
+a retailer gets its recorded page back, so each request runs the whole
+scrape (fetch or page load, readiness, parse, relevance) and the result
+cache is off by default.
+
+Runs one step per concurrency level and reports throughput, p50/p95/p99
+latency, error rates by status and the peak number of Chromium processes
+and RSS of the server, to find where one container stops scaling.
+
+    python -m backend.benchmarks.load_test --concurrency 1 2 4 8 16 --duration 30
+    python -m backend.benchmarks.load_test --env BROWSER_MAX_PAGES=8 --report load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+import httpx
+from backend.benchmarks.bench_relevance import load_queries
+from backend.benchmarks.fixtures import FIXTURES_DIR, load_index
+from backend.benchmarks.processes import process_name, process_tree, tree_rss_mb
+from backend.benchmarks.standin import StandIn
+from backend.scrapers import DOMAIN_SCRAPER
+
+# process names of the browser pool's Chromium (full build and headless shell)
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def server_env(overrides: dict[str, str], extra: dict[str, str], tmp: str, cache: bool) -> dict:
+    """Environment of the app under test: stand-in origins, no rate limit, no background refresh."""
+    env = {
+        **os.environ,
+        "ORIGIN_OVERRIDES": json.dumps(overrides),
+        "RATE_LIMIT_PER_MINUTE": "1000000",
+        # no background refresh: scraping every model at startup, or the hottest
+        # pairs every interval, would skew latencies and browser counts
+        "REFRESH_SEED_MODELS": "false",
+        "REFRESH_TOP_K": "0",
+        "CATALOG_PATH": str(Path(tmp) / "catalog.sqlite3"),
+        "CACHE_BACKEND": "memory",
+    }
+    if not cache:
+        env["CACHE_TTL_SECONDS"] = "0"
+        env["CACHE_STALE_SECONDS"] = "0"
+    return {**env, **extra}
+
+
+def percentile_ms(sorted_samples: list[float], q: float) -> float | None:
+    if not sorted_samples:
+        return None
+    index = min(len(sorted_samples) - 1, round(q * (len(sorted_samples) - 1)))
+    return round(sorted_samples[index] * 1000, 1)
+
+
+class ProcessSampler:
+    """Peak Chromium process count and RSS of the server's process tree."""
+
+    def __init__(self, pid: int | None, interval: float = 0.25):
+        self.pid = pid
+        self.interval = interval
+        self.peak_browser_processes = 0
+        self.peak_rss_mb = 0.0
+
+    def sample(self):
+        if self.pid is None:
+            return
+        browsers = sum(
+            1 for p in process_tree(self.pid)
+            if process_name(p).startswith(BROWSER_PROCESS_NAMES)
+        )
+        self.peak_browser_processes = max(self.peak_browser_processes, browsers)
+        self.peak_rss_mb = max(self.peak_rss_mb, tree_rss_mb(self.pid))
+
+    async def run(self):
+        while True:
+            # /proc reads are quick, but keep them off the load generator's loop
+            await asyncio.to_thread(self.sample)
+            await asyncio.sleep(self.interval)
+
+
+async def wait_until_ready(base_url: str, server: subprocess.Popen | None, timeout: float = 120):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if server is not None and server.poll() is not None:
+                sys.exit(f"Server exited with code {server.returncode}")
+            try:
+                if (await client.get("/stats")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.5)
+    sys.exit(f"Server at {base_url} not ready after {timeout:.0f}s")
+
+
+async def run_step(client: httpx.AsyncClient, concurrency: int, duration: float,
+                   targets: list[tuple[str, list[str]]], rng: random.Random, pid: int | None) -> dict:
+    """concurrency workers sending searches back to back for duration seconds."""
+    latencies, statuses, by_domain = [], {}, {}
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        while time.monotonic() < deadline:
+            domain, terms = rng.choice(targets)
+            term = rng.choice(terms)
+            body = {"url": DOMAIN_SCRAPER[domain].build_search_url(term), "term": term}
+
+            started = time.perf_counter()
+            try:
+                resp = await client.post("/extract-price", json=body)
+                # a 404 is a scrape that found nothing, not a failure of the server
+                outcome = str(resp.status_code)
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            elapsed = time.perf_counter() - started
+
+            statuses[outcome] = statuses.get(outcome, 0) + 1
+            counts = by_domain.setdefault(domain, {"requests": 0, "errors": 0})
+            counts["requests"] += 1
+            if outcome in ("200", "404"):
+                latencies.append(elapsed)
+            else:
+                counts["errors"] += 1
+
+    sampler = ProcessSampler(pid)
+    sampling = asyncio.create_task(sampler.run())
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        sampling.cancel()
+    elapsed = time.perf_counter() - started
+
+    requests = sum(statuses.values())
+    errors = requests - len(latencies)
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "latency_ms": {
+            "p50": percentile_ms(latencies, 0.50),
+            "p95": percentile_ms(latencies, 0.95),
+            "p99": percentile_ms(latencies, 0.99),
+            "mean": round(statistics.fmean(latencies) * 1000, 1) if latencies else None,
+        },
+        "error_rate": round(errors / requests, 4) if requests else 0,
+        "statuses": statuses,
+        "domains": by_domain,
+        "peak_browser_processes": sampler.peak_browser_processes,
+        "peak_server_rss_mb": round(sampler.peak_rss_mb, 1),
+    }
+
+
+async def load_test(args, targets: list[tuple[str, list[str]]], base_url: str, pid: int | None) -> list[dict]:
+    await wait_until_ready(base_url, None)
+    rng = random.Random(args.seed)
+    steps = []
+
+    limits = httpx.Limits(max_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout, limits=limits) as client:
+        for concurrency in args.concurrency:
+            step = await run_step(client, concurrency, args.duration, targets, rng, pid)
+            steps.append(step)
+
+            latency = step["latency_ms"]
+            print(f"c={concurrency:<4} {step['requests']:>6} req  {step['throughput_rps']:>7} req/s  "
+                  f"p50 {latency['p50']} p95 {latency['p95']} p99 {latency['p99']} ms  "
+                  f"errors {step['error_rate']:.1%}  chromium {step['peak_browser_processes']}  "
+                  f"rss {step['peak_server_rss_mb']} MB")
+
+            if args.pause:
+                await asyncio.sleep(args.pause)
+
+    return steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--domains", nargs="+", help="only these retailers")
+    parser.add_argument("--no-browser", action="store_true",
+                        help="skip the Playwright retailers")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="concurrent clients, one step per value")
+    parser.add_argument("--duration", type=float, default=20, help="seconds per step")
+    parser.add_argument("--pause", type=float, default=2, help="seconds between steps")
+    parser.add_argument("--terms", type=int, default=0,
+                        help="number of models.json terms in the mix (0 = all)")
+    parser.add_argument("--timeout", type=float, default=60, help="client timeout per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache", action="store_true",
+                        help="keep the result cache on (default: every request scrapes)")
+    parser.add_argument("--env", nargs="+", default=[], metavar="KEY=VALUE",
+                        help="extra environment for the server, e.g. BROWSER_MAX_PAGES=8")
+    parser.add_argument("--url", help="load an already running server instead "
+                        "(its ORIGIN_OVERRIDES must point at the fixtures)")
+    parser.add_argument("--pid", type=int, help="with --url: server pid to count browser processes")
+    parser.add_argument("--report", type=Path, help="write the steps as JSON")
+    args = parser.parse_args()
+
+    fixtures = [
+        f for f in load_index(args.fixtures)
+        if f["domain"] in DOMAIN_SCRAPER
+        and (not args.domains or f["domain"] in args.domains)
+        and not (args.no_browser and DOMAIN_SCRAPER[f["domain"]].uses_browser)
+    ]
+    if not fixtures:
+        sys.exit(f"No fixtures in {args.fixtures}, record some with: python -m backend.benchmarks.record")
+
+    terms = load_queries()
+    if args.terms:
+        terms = random.Random(args.seed).sample(terms, min(args.terms, len(terms)))
+    domains = sorted({f["domain"] for f in fixtures})
+    targets = [(domain, terms) for domain in domains]
+
+    stand_in = None
+    server = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            if args.url:
+                base_url, pid = args.url.rstrip("/"), args.pid
+            else:
+                stand_in = StandIn([args.fixtures / f["har"] for f in fixtures])
+                overrides = stand_in.start()
+                extra = dict(item.split("=", 1) for item in args.env)
+                port = free_port()
+                server = subprocess.Popen(
+                    [sys.executable, "-m", "uvicorn", "backend.app:app",
+                     "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+                    env=server_env(overrides, extra, tmp, args.cache),
+                )
+                base_url, pid = f"http://127.0.0.1:{port}", server.pid
+                asyncio.run(wait_until_ready(base_url, server))
+
+            print(f"{len(domains)} retailers x {len(terms)} terms against {base_url}")
+            steps = asyncio.run(load_test(args, targets, base_url, pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        if stand_in is not None:
+            stand_in.stop()
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({
+                "meta": {
+                    "created": time.time(),
+                    "domains": domains,
+                    "terms": len(terms),
+                    "duration": args.duration,
+                    "cache": args.cache,
+                    "env": args.env,
+                },
+                "steps": steps,
+            }, f, indent=2)
+        print(f"report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
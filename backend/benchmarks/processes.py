@@ -0,0 +1,83 @@
+"""
+Process tree memory sampling for the benchmarks (Linux /proc, no psutil):
+this process plus its children, e.g. the Chromium processes of the
+browser pool.
+"""
+import os
+import threading
+from pathlib import Path
+
+
+def children_of(pid: int) -> list[int]:
+    children = []
+    for task in Path(f"/proc/{pid}/task").glob("*"):
+        try:
+            children += [int(c) for c in (task / "children").read_text().split()]
+        except OSError:
+            continue
+    return children
+
+
+def process_tree(pid: int | None = None) -> list[int]:
+    """pid (default: this process) and all its descendants."""
+    tree = [pid or os.getpid()]
+    for parent in tree:
+        tree += children_of(parent)
+    return tree
+
+
+def rss_mb(pid: int) -> float:
+    """Current resident memory of a process, 0 if it is gone."""
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def process_name(pid: int) -> str:
+    try:
+        return Path(f"/proc/{pid}/comm").read_text().strip()
+    except OSError:
+        return ""
+
+
+def tree_rss_mb(pid: int | None = None) -> float:
+    return sum(rss_mb(p) for p in process_tree(pid))
+
+
+class RssSampler:
+    """
+    Samples the process tree's total RSS in a background thread and keeps
+    the peak.
+
+        with RssSampler() as sampler:
+            ...
+        sampler.peak_mb
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sample(self):
+        self.peak_mb = max(self.peak_mb, tree_rss_mb())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        self.sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.sample()
@@ -0,0 +1,74 @@
+"""
+Record retailer fixtures for the offline benchmarks.
+
+Runs every scraper live, once per term, and saves the responses it needed
+(HTTP requests, and the browser HAR for Playwright retailers) under
+backend/benchmarks/fixtures/. Fixtures are not committed: record them
+locally before benchmarking.
+
+    python -m backend.benchmarks.record [--domains ebay.ca watchory.ca] [--terms "GA-2100"]
+"""
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+from backend.benchmarks.bench_relevance import load_queries
+from backend.benchmarks.fixtures import FIXTURES_DIR, RecordingHttpClient, read_har, save_fixture
+from backend.scrapers import DOMAIN_SCRAPER
+from backend.scrapers.browser import BrowserPool
+
+
+async def record(domains: list[str], terms: list[str], fixtures_dir: Path):
+    http_client = RecordingHttpClient()
+    await http_client.start()
+    browser_pool = BrowserPool(size=1, max_pages=1)
+    await browser_pool.start()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            browser_har = Path(tmp) / "browser.har"
+
+            for domain in domains:
+                scraper_class = DOMAIN_SCRAPER[domain]
+
+                for term in terms:
+                    url = scraper_class.build_search_url(term)
+                    http_client.entries = []
+                    browser_har.unlink(missing_ok=True)
+                    browser_pool.context_options = {
+                        "record_har_path": str(browser_har),
+                        "record_har_content": "embed",
+                    }
+
+                    scraper = scraper_class(
+                        browser_pool=browser_pool, http_client=http_client)
+                    try:
+                        products = await scraper.scrape(url, term)
+                    except Exception as e:
+                        print(f"{domain:<22} {term!r}: failed ({e})")
+                        continue
+
+                    # the browser HAR is written when its context closes
+                    entries = list(http_client.entries)
+                    if browser_har.exists():
+                        entries += read_har(browser_har)
+
+                    save_fixture(fixtures_dir, domain, term, url, entries)
+                    print(f"{domain:<22} {term!r}: {len(products)} products, {len(entries)} responses")
+    finally:
+        await http_client.stop()
+        await browser_pool.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--domains", nargs="+", default=list(DOMAIN_SCRAPER))
+    parser.add_argument("--terms", nargs="+", default=load_queries()[:3])
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    asyncio.run(record(args.domains, args.terms, args.fixtures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Local stand-in for the retailer sites: serves recorded HAR responses on
+127.0.0.1, one port per recorded origin, so the scrapers (pointed at it
+through origins.ORIGIN_OVERRIDES) run fully offline.
+"""
+import base64
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+from backend.benchmarks.fixtures import read_har
+from backend.scrapers.origins import origin_of
+
+
+def path_of(url: str) -> str:
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def response_body(entry: dict) -> bytes:
+    content = entry["response"].get("content", {})
+    text = content.get("text") or ""
+    if content.get("encoding") == "base64":
+        return base64.b64decode(text)
+    return text.encode("utf-8")
+
+
+class Responses:
+    """Recorded responses of one origin, by method + path (and query)."""
+
+    def __init__(self):
+        self.exact: dict[tuple[str, str], dict] = {}
+        self.by_path: dict[tuple[str, str], dict] = {}
+
+    def add(self, entry: dict):
+        method = entry["request"]["method"]
+        url = entry["request"]["url"]
+        self.exact.setdefault((method, path_of(url)), entry)
+        self.by_path.setdefault((method, urlsplit(url).path), entry)
+
+    def find(self, method: str, path: str) -> dict | None:
+        # same query first, then any recording of the path (cache busters, timestamps)
+        return self.exact.get((method, path)) or self.by_path.get((method, urlsplit(path).path))
+
+
+def make_handler(responses: Responses):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # headers and body go out in separate writes
+        disable_nagle_algorithm = True
+
+        def respond(self):
+            entry = responses.find(self.command, self.path)
+            if entry is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            body = response_body(entry)
+            response = entry["response"]
+            self.send_response(response["status"])
+            self.send_header("Content-Type", response["content"].get("mimeType") or "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            if response.get("redirectURL"):
+                self.send_header("Location", response["redirectURL"])
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            self.respond()
+
+        def do_POST(self):
+            # drain the body, answer like the recorded request
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self.respond()
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+class StandIn:
+    """
+    Usage:
+        stand_in = StandIn(har_paths)
+        overrides = stand_in.start()   # {"https://www.ebay.ca": "http://127.0.0.1:PORT", ...}
+        ...
+        stand_in.stop()
+    """
+
+    def __init__(self, har_paths: list[Path]):
+        self.origins: dict[str, Responses] = {}
+        for path in har_paths:
+            for entry in read_har(path):
+                origin = origin_of(entry["request"]["url"])
+                self.origins.setdefault(origin, Responses()).add(entry)
+
+        self._servers: list[ThreadingHTTPServer] = []
+
+    def start(self) -> dict[str, str]:
+        """Start one server per origin; returns the origin overrides."""
+        overrides = {}
+        for origin, responses in self.origins.items():
+            server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(responses))
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self._servers.append(server)
+            overrides[origin] = f"http://127.0.0.1:{server.server_address[1]}"
+        return overrides
+
+    def stop(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
@@ -0,0 +1,186 @@
+import asyncio
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+import orjson
+from backend.relevance import normalize
+from backend.product import Product
+
+
+# ============================================================
+# Keys
+# ============================================================
+
+def cache_key(domain: str, term: str) -> str:
+    """
+    Cache key for a retailer search, so "GA-2100", "ga 2100 " and
+    "Ga-2100" all share one entry.
+    """
+    return f"{domain}|{normalize(term)}"
+
+
+# ============================================================
+# Entries
+# ============================================================
+
+@dataclass
+class CacheEntry:
+    products: list[Product]
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+# ============================================================
+# Backends
+# ============================================================
+
+class ResultCache(ABC):
+    """
+    Cache of scraped products per (retailer, term) with a bounded number of
+    entries (least recently used entries are evicted first).
+
+    Entries are fresh for `ttl` seconds, then stale for another `stale_ttl`
+    seconds: stale entries are still returned so they can be served while a
+    refresh runs (stale-while-revalidate), and dropped after that.
+    """
+
+    def __init__(self, ttl: float = 900, max_entries: int = 1000, stale_ttl: float = 0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return entry.age < self.ttl
+
+    @property
+    def max_age(self) -> float:
+        return self.ttl + self.stale_ttl
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the cached entry (fresh or stale), or None on a miss / expired entry."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, products: list[Product]):
+        pass
+
+    async def close(self):
+        pass
+
+
+class MemoryCache(ResultCache):
+    """In-process LRU cache (lost on restart)."""
+
+    def __init__(self, ttl: float = 900, max_entries: int = 1000, stale_ttl: float = 0):
+        super().__init__(ttl, max_entries, stale_ttl)
+        # oldest access first
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry.age >= self.max_age:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, products: list[Product]):
+        self._entries[key] = CacheEntry(products, time.time())
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class SqliteCache(ResultCache):
+    """
+    SQLite-backed cache in a local file, so warm entries survive restarts.
+    Queries run in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, path: str, ttl: float = 900, max_entries: int = 1000, stale_ttl: float = 0):
+        super().__init__(ttl, max_entries, stale_ttl)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_results (
+                key TEXT PRIMARY KEY,
+                products TEXT NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS scrape_results_accessed ON scrape_results (accessed_at)")
+        self._conn.commit()
+
+    async def get(self, key: str) -> CacheEntry | None:
+        async with self._lock:
+            return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, products: list[Product]):
+        async with self._lock:
+            await asyncio.to_thread(self._set, key, products)
+
+    async def close(self):
+        self._conn.close()
+
+    def _get(self, key: str) -> CacheEntry | None:
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT products, stored_at FROM scrape_results WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        products, stored_at = row
+        if now - stored_at >= self.max_age:
+            self._conn.execute(
+                "DELETE FROM scrape_results WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+
+        self._conn.execute(
+            "UPDATE scrape_results SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        return CacheEntry([Product.from_dict(p) for p in orjson.loads(products)], stored_at)
+
+    def _set(self, key: str, products: list[Product]):
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO scrape_results (key, products, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, orjson.dumps(products).decode(), now, now),
+        )
+
+        # evict expired entries, then the least recently used ones over the limit
+        self._conn.execute(
+            "DELETE FROM scrape_results WHERE stored_at <= ?", (now - self.max_age,))
+        self._conn.execute("""
+            DELETE FROM scrape_results WHERE key IN (
+                SELECT key FROM scrape_results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+        self._conn.commit()
+
+
+def create_cache(backend: str, ttl: float, max_entries: int, path: str, stale_ttl: float = 0) -> ResultCache:
+    """Build the cache backend selected by name ("memory" or "sqlite")."""
+    if backend == "memory":
+        return MemoryCache(ttl=ttl, max_entries=max_entries, stale_ttl=stale_ttl)
+    if backend == "sqlite":
+        return SqliteCache(path, ttl=ttl, max_entries=max_entries, stale_ttl=stale_ttl)
+
+    raise ValueError(f"Unknown cache backend '{backend}'")
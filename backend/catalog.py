@@ -0,0 +1,164 @@
+import asyncio
+import sqlite3
+import time
+from backend.product import Product
+from backend.relevance import base_model, extract_model_tokens, normalize
+
+
+class Catalog:
+    """
+    Every product ever scraped, per retailer, in a local SQLite file.
+
+    Products are upserted (first_seen / last_seen) after each scrape and
+    indexed by their model tokens and base models (an inverted index), so
+    "cheapest GA-2100 across retailers" is an index lookup instead of a
+    scrape. A listing that a new scrape of the same search no longer shows
+    (sold out or delisted) is expired, unless another search saw it since.
+    Queries run in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, path: str, max_age: float = 21600):
+        self.path = path
+        # products / searches older than this are stale (scrape again)
+        self.max_age = max_age
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS catalog_products (
+                id INTEGER PRIMARY KEY,
+                retailer TEXT NOT NULL,
+                name TEXT NOT NULL,
+                price REAL NOT NULL,
+                currency TEXT,
+                url TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                UNIQUE (retailer, name)
+            );
+
+            -- inverted index: model token / base model -> products
+            CREATE TABLE IF NOT EXISTS catalog_models (
+                token TEXT NOT NULL,
+                is_base INTEGER NOT NULL,
+                product_id INTEGER NOT NULL REFERENCES catalog_products (id),
+                PRIMARY KEY (token, is_base, product_id)
+            ) WITHOUT ROWID;
+
+            -- searches (retailer, normalized term) each product was found under
+            CREATE TABLE IF NOT EXISTS catalog_search_products (
+                retailer TEXT NOT NULL,
+                term TEXT NOT NULL,
+                product_id INTEGER NOT NULL REFERENCES catalog_products (id),
+                PRIMARY KEY (retailer, term, product_id)
+            ) WITHOUT ROWID;
+
+            -- when each retailer was last scraped for a (normalized) term
+            CREATE TABLE IF NOT EXISTS catalog_searches (
+                retailer TEXT NOT NULL,
+                term TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                PRIMARY KEY (retailer, term)
+            );
+        """)
+        self._conn.commit()
+
+    async def upsert(self, retailer: str, term: str, products: list[Product]):
+        """Record a scrape of a retailer for a term."""
+        async with self._lock:
+            await asyncio.to_thread(self._upsert, retailer, term, products)
+
+    async def find(self, term: str) -> list[Product]:
+        """
+        Fresh products sharing a model token or base model with the term
+        (empty when the term has no model number).
+        """
+        async with self._lock:
+            return await asyncio.to_thread(self._find, term)
+
+    async def stale_retailers(self, retailers: list[str], term: str) -> list[str]:
+        """Retailers not scraped for the term within max_age."""
+        async with self._lock:
+            return await asyncio.to_thread(self._stale_retailers, retailers, term)
+
+    async def close(self):
+        self._conn.close()
+
+    def _upsert(self, retailer: str, term: str, products: list[Product]):
+        now = time.time()
+        term = normalize(term)
+        previous = self._conn.execute(
+            "SELECT scraped_at FROM catalog_searches WHERE retailer = ? AND term = ?",
+            (retailer, term),
+        ).fetchone()
+
+        for product in products:
+            product_id, = self._conn.execute("""
+                INSERT INTO catalog_products (retailer, name, price, currency, url, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (retailer, name) DO UPDATE SET
+                    price = excluded.price,
+                    currency = excluded.currency,
+                    url = COALESCE(excluded.url, url),
+                    last_seen = excluded.last_seen
+                RETURNING id
+            """, (retailer, product.name, product.price, product.currency, product.url, now, now)).fetchone()
+
+            models = extract_model_tokens(product.name)
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO catalog_models (token, is_base, product_id) VALUES (?, ?, ?)",
+                [(m, 0, product_id) for m in models]
+                + [(b, 1, product_id) for b in {base_model(m) for m in models}],
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO catalog_search_products (retailer, term, product_id) VALUES (?, ?, ?)",
+                (retailer, term, product_id),
+            )
+
+        if previous is not None:
+            # found under this search before but not now, and not seen by any search since
+            self._expire([product_id for product_id, in self._conn.execute("""
+                SELECT p.id
+                FROM catalog_search_products s JOIN catalog_products p ON p.id = s.product_id
+                WHERE s.retailer = ? AND s.term = ? AND p.last_seen <= ?
+            """, (retailer, term, previous[0]))])
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO catalog_searches (retailer, term, scraped_at) VALUES (?, ?, ?)",
+            (retailer, term, now),
+        )
+        self._conn.commit()
+
+    def _expire(self, product_ids: list[int]):
+        rows = [(product_id,) for product_id in product_ids]
+        self._conn.executemany("DELETE FROM catalog_models WHERE product_id = ?", rows)
+        self._conn.executemany("DELETE FROM catalog_search_products WHERE product_id = ?", rows)
+        self._conn.executemany("DELETE FROM catalog_products WHERE id = ?", rows)
+
+    def _find(self, term: str) -> list[Product]:
+        models = extract_model_tokens(term)
+        if not models:
+            return []
+
+        bases = {base_model(m) for m in models}
+        rows = self._conn.execute(f"""
+            SELECT DISTINCT p.retailer, p.name, p.price, p.currency, p.url
+            FROM catalog_models m JOIN catalog_products p ON p.id = m.product_id
+            WHERE ((m.is_base = 0 AND m.token IN ({",".join("?" * len(models))}))
+                OR (m.is_base = 1 AND m.token IN ({",".join("?" * len(bases))})))
+              AND p.last_seen >= ?
+        """, (*models, *bases, time.time() - self.max_age)).fetchall()
+
+        return [
+            Product(name=name, price=price, currency=currency, url=url, retailer=retailer)
+            for retailer, name, price, currency, url in rows
+        ]
+
+    def _stale_retailers(self, retailers: list[str], term: str) -> list[str]:
+        fresh = {
+            retailer for retailer, in self._conn.execute(
+                "SELECT retailer FROM catalog_searches WHERE term = ? AND scraped_at >= ?",
+                (normalize(term), time.time() - self.max_age),
+            )
+        }
+        return [r for r in retailers if r not in fresh]
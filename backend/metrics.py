@@ -0,0 +1,110 @@
+"""
+Prometheus metrics, served by GET /metrics.
+
+Per retailer: time per scrape stage (queue / fetch / navigation / readiness /
+extraction / parse, and relevance per search), scrape failures, products
+scraped vs matched, result cache lookups by status, and fan-out timeouts.
+Process-wide: browser pool and scheduler utilisation, and rate-limit
+rejections per endpoint.
+"""
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# from milliseconds (parse, relevance) to the 30s navigation timeout
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                 1, 2.5, 5, 10, 20, 30, 60)
+
+STAGE_SECONDS = Histogram(
+    "scraper_stage_seconds",
+    "Time spent in each stage of a scrape (relevance: per search)",
+    ["domain", "stage"],
+    buckets=STAGE_BUCKETS,
+)
+SCRAPES = Counter(
+    "scrapes_total",
+    "Scrapes run, by outcome (ok, rejected, failed)",
+    ["domain", "outcome"],
+)
+SCRAPE_FAILURES = Counter(
+    "scrape_failures_total",
+    "Failed scrapes by exception type",
+    ["domain", "error"],
+)
+PRODUCTS_SCRAPED = Counter(
+    "products_scraped_total",
+    "Products read off the retailer's search page",
+    ["domain"],
+)
+PRODUCTS_SEARCHED = Counter(
+    "search_products_total",
+    "Products scored for relevance in search results",
+    ["domain"],
+)
+PRODUCTS_MATCHED = Counter(
+    "search_matches_total",
+    "Products that passed the relevance filter in search results",
+    ["domain"],
+)
+CACHE_LOOKUPS = Counter(
+    "result_cache_lookups_total",
+    "Searches by where their products came from (hit, stale, miss, coalesced)",
+    ["domain", "status"],
+)
+TIMEOUTS = Counter(
+    "retailer_timeouts_total",
+    "Retailers dropped from a multi-retailer search for being too slow",
+    ["domain"],
+)
+RATE_LIMITED = Counter(
+    "rate_limited_requests_total",
+    "Requests rejected by the rate limiter (429)",
+    ["path"],
+)
+
+BROWSER_PAGES_IN_USE = Gauge("browser_pages_in_use", "Browser pages currently open")
+BROWSER_PAGES_MAX = Gauge("browser_pages_max", "Maximum concurrently open browser pages")
+SCHEDULER_WAITING = Gauge("scheduler_waiting", "Scrapes queued for a slot")
+SCHEDULER_RUNNING = Gauge("scheduler_running", "Scrapes holding a slot")
+
+
+def track_browser_pool(browser_pool):
+    """Report the pool's utilisation, read at every scrape of /metrics."""
+    BROWSER_PAGES_IN_USE.set_function(lambda: browser_pool.pages_in_use)
+    BROWSER_PAGES_MAX.set(browser_pool.max_pages)
+
+
+def track_scheduler(scheduler):
+    SCHEDULER_WAITING.set_function(lambda: scheduler.waiting)
+    SCHEDULER_RUNNING.set_function(lambda: scheduler.running)
+
+
+def observe_stages(domain: str, timings: dict[str, float]):
+    for stage, seconds in timings.items():
+        STAGE_SECONDS.labels(domain, stage).observe(seconds)
+
+
+def observe_scrape(domain: str, timings: dict[str, float], products: int):
+    """A successful scrape: its stage times and number of products."""
+    SCRAPES.labels(domain, "ok").inc()
+    PRODUCTS_SCRAPED.labels(domain).inc(products)
+    observe_stages(domain, timings)
+
+
+def observe_failure(domain: str, error: Exception):
+    SCRAPES.labels(domain, "failed").inc()
+    SCRAPE_FAILURES.labels(domain, type(error).__name__).inc()
+
+
+def observe_cache(domain: str, status: str):
+    CACHE_LOOKUPS.labels(domain, status).inc()
+
+
+def observe_search(domain: str, products: int, matches: int, relevance: float):
+    """A search result built for a retailer (from a scrape or the cache)."""
+    PRODUCTS_SEARCHED.labels(domain).inc(products)
+    PRODUCTS_MATCHED.labels(domain).inc(matches)
+    STAGE_SECONDS.labels(domain, "relevance").observe(relevance)
+
+
+def latest() -> tuple[bytes, str]:
+    """The metrics in the Prometheus text format, and its content type."""
+    return generate_latest(), CONTENT_TYPE_LATEST
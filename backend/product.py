@@ -0,0 +1,28 @@
+from dataclasses import asdict, dataclass
+
+
+@dataclass(slots=True)
+class Product:
+    """
+    A product scraped from a retailer's search results.
+
+    - currency: ISO code of the price, None when the retailer's is unknown
+      (set by the search, see BaseScraper.currency)
+    - retailer: domain it was scraped from (set by the search)
+    - score: relevance to the search term (set on the filtered copies)
+    """
+    name: str
+    price: float
+    currency: str | None = None
+    url: str | None = None
+    in_stock: bool = True
+    retailer: str | None = None
+    score: float | None = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Product":
+        """Build a product from a dict (e.g. a cached {"name", "price"} entry)."""
+        return cls(**data)
@@ -0,0 +1,81 @@
+"""
+Opt-in per-request profiling (admin only).
+
+A request sent with `X-Profile: 1` and the right `X-Admin-Token` runs under
+pyinstrument: the request's own coroutines on the event loop (async mode,
+so concurrent requests don't show up in it) plus the CPU work it hands to
+the executor (parsing, relevance scoring), profiled inside the worker
+thread or process and merged in. The result is written as a speedscope
+file (https://www.speedscope.app) named after the request id.
+"""
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from pyinstrument.session import Session
+
+# sessions recorded in the executor for the request being profiled (None when it isn't)
+worker_sessions: ContextVar[list | None] = ContextVar("worker_sessions", default=None)
+
+
+def profiled_call(fn, *args, **kwargs):
+    """Run fn in an executor worker under its own profiler; returns (result, session as JSON)."""
+    profiler = Profiler(async_mode="disabled")
+    profiler.start()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        session = profiler.stop()
+    # plain dicts, so it crosses the process pool boundary
+    return result, session.to_json()
+
+
+class RequestProfiler:
+    """
+    Profiles at most `max_concurrent` requests at a time (profiling slows
+    a request down); the others run normally.
+    """
+
+    def __init__(self, directory: Path, max_concurrent: int = 1):
+        self.directory = Path(directory)
+        self.max_concurrent = max_concurrent
+        self.active = 0
+
+    @asynccontextmanager
+    async def profile(self):
+        """
+        Profile the block; yields the request id, or None when the cap is
+        reached (the block then runs unprofiled).
+        """
+        if self.active >= self.max_concurrent:
+            yield None
+            return
+
+        self.active += 1
+        request_id = uuid.uuid4().hex
+        sessions = []
+        token = worker_sessions.set(sessions)
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            yield request_id
+        finally:
+            session = profiler.stop()
+            worker_sessions.reset(token)
+            self.active -= 1
+            # rendering walks the whole call tree: keep it off the loop
+            await asyncio.to_thread(self.save, request_id, session, sessions)
+
+    def path(self, request_id: str) -> Path:
+        return self.directory / f"{request_id}.speedscope.json"
+
+    def save(self, request_id: str, session: Session, worker_json: list[dict]):
+        for data in worker_json:
+            session = Session.combine(session, Session.from_json(data))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path(request_id).write_text(
+            SpeedscopeRenderer().render(session), encoding="utf-8")
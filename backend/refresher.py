@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Awaitable, Callable
+from backend.cache import ResultCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+
+class Refresher:
+    """
+    Keeps popular searches warm in the result cache.
+
+    Every search is recorded to track (retailer, term) popularity. A background
+    loop re-scrapes the hottest pairs, plus the pinned ones (the curated model
+    list), shortly before their cache entry goes stale, and stale entries that
+    were just served are refreshed right away. Popularity decays on every
+    round so yesterday's hot searches cool down.
+
+    A pair whose refresh failed is not retried before its backoff (`backoff`
+    seconds, doubled on every failure in a row up to `max_backoff`) is over,
+    so retailers that keep failing don't hold the scrape slots every round.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str, str], Awaitable],
+        cache: ResultCache,
+        interval: float = 60,
+        top_k: int = 50,
+        refresh_ahead: float = 0.8,
+        concurrency: int = 2,
+        decay: float = 0.9,
+        backoff: float = 60,
+        max_backoff: float = 3600,
+    ):
+        # refresh(domain, term) re-scrapes a pair and stores it in the cache
+        self.refresh = refresh
+        self.cache = cache
+        self.interval = interval
+        self.top_k = top_k
+        # refresh entries older than this fraction of the cache TTL
+        self.refresh_ahead = refresh_ahead
+        self.decay = decay
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        # keyed on the cache key, so term variants share one counter
+        self.popularity: Counter[str] = Counter()
+        self.pinned: set[str] = set()
+        self._pairs: dict[str, tuple[str, str]] = {}
+        # key -> (failures in a row, monotonic time of the last one)
+        self._failures: dict[str, tuple[int, float]] = {}
+
+        self._slots = asyncio.Semaphore(concurrency)
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self._loop_task: asyncio.Task | None = None
+
+    def record(self, domain: str, term: str):
+        """Count one search for (domain, term)."""
+        key = self._track(domain, term)
+        self.popularity[key] += 1
+
+    def pin(self, domain: str, term: str):
+        """Always keep (domain, term) warm, regardless of popularity."""
+        self.pinned.add(self._track(domain, term))
+
+    def refresh_soon(self, domain: str, term: str):
+        """
+        Refresh (domain, term) in the background unless it's already being
+        refreshed or is backing off after a failure.
+        """
+        key = self._track(domain, term)
+        if key in self._refreshing or self.backing_off(key):
+            return
+
+        task = asyncio.create_task(self._refresh(key, domain, term))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    @property
+    def refreshing(self) -> int:
+        return len(self._refreshing)
+
+    def backing_off(self, key: str) -> bool:
+        """Whether key's last refresh failed too recently to retry it yet."""
+        if key not in self._failures:
+            return False
+        failures, failed_at = self._failures[key]
+        delay = min(self.max_backoff, self.backoff * 2 ** (failures - 1))
+        return time.monotonic() - failed_at < delay
+
+    def hot_keys(self) -> list[str]:
+        popular = [key for key, _ in self.popularity.most_common(self.top_k)]
+        return list(dict.fromkeys([*self.pinned, *popular]))
+
+    async def refresh_hot(self):
+        """One round: refresh hot pairs that are missing or about to go stale."""
+        for key in self.hot_keys():
+            if self.backing_off(key):
+                continue
+            entry = await self.cache.get(key)
+            if entry is None or entry.age >= self.cache.ttl * self.refresh_ahead:
+                self.refresh_soon(*self._pairs[key])
+
+        # cool down popularity and forget pairs nobody searches anymore
+        for key in list(self.popularity):
+            self.popularity[key] *= self.decay
+            if self.popularity[key] < 0.1:
+                del self.popularity[key]
+                if key not in self.pinned:
+                    self._pairs.pop(key, None)
+                    self._failures.pop(key, None)
+
+    async def start(self):
+        self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        tasks = list(self._refreshing.values())
+        if self._loop_task:
+            tasks.append(self._loop_task)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _track(self, domain: str, term: str) -> str:
+        key = cache_key(domain, term)
+        self._pairs.setdefault(key, (domain, term))
+        return key
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh_hot()
+            except Exception:
+                logger.exception("Refresh round failed")
+            await asyncio.sleep(self.interval)
+
+    async def _refresh(self, key: str, domain: str, term: str):
+        # bounded, so background refreshes never crowd out live searches
+        async with self._slots:
+            try:
+                await self.refresh(domain, term)
+            except Exception:
+                failures = self._failures.get(key, (0, 0))[0] + 1
+                self._failures[key] = (failures, time.monotonic())
+                logger.warning("Background refresh failed for %s '%s' (%d in a row)",
+                               domain, term, failures, exc_info=True)
+            else:
+                self._failures.pop(key, None)
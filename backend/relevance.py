@@ -1,5 +1,9 @@
+import heapq
 import re
-from typing import List, Set
+from dataclasses import replace
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Set, Tuple
 
 
 # ============================================================
@@ -32,6 +36,10 @@ FEATURE_KEYWORDS = {
 # Normalization & Tokenization
 # ============================================================
 
+NON_ALPHANUMERIC = re.compile(r"[^a-z0-9 ]")
+WHITESPACE = re.compile(r"\s+")
+
+
 def normalize(text: str) -> str:
     """
     Normalize text for comparison:
@@ -40,8 +48,8 @@ def normalize(text: str) -> str:
     - normalize whitespace
     """
     text = text.lower()
-    text = re.sub(r"[^a-z0-9 ]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = NON_ALPHANUMERIC.sub(" ", text)
+    text = WHITESPACE.sub(" ", text).strip()
     return text
 
 
@@ -56,6 +64,7 @@ def tokenize(text: str) -> List[str]:
 # Model Token Extraction
 # ============================================================
 
+@lru_cache(maxsize=8192)
 def is_model_token(token: str) -> bool:
     """
     Determine whether a token looks like a watch model code.
@@ -83,7 +92,14 @@ def extract_model_tokens(text: str) -> Set[str]:
     - GA 700
     - SNXS77K1
     """
-    tokens = tokenize(normalize(text))
+    return model_tokens(tokenize(normalize(text)))
+
+
+def model_tokens(tokens: List[str]) -> Set[str]:
+    """
+    Model-like tokens from already normalized tokens
+    (see extract_model_tokens).
+    """
     combined = []
     skip = False
 
@@ -106,6 +122,7 @@ def extract_model_tokens(text: str) -> Set[str]:
 # Base Model Logic (CRITICAL FIX)
 # ============================================================
 
+@lru_cache(maxsize=8192)
 def base_model(token: str) -> str:
     """
     Extract the base model for comparison.
@@ -192,9 +209,14 @@ def accessory_penalty(text: str) -> int:
     3. If accessory keywords appear in ambiguous context
        → Mild penalty (-5)
     """
-    tokens = set(tokenize(normalize(text)))
     lower_text = normalize(text)
+    return normalized_accessory_penalty(set(tokenize(lower_text)), lower_text)
 
+
+def normalized_accessory_penalty(tokens: Set[str], lower_text: str) -> int:
+    """
+    accessory_penalty for an already normalized text and its tokens.
+    """
     has_accessory_kw = bool(tokens & ACCESSORY_KEYWORDS)
     has_watch_kw = bool(tokens & WATCH_KEYWORDS)
 
@@ -218,77 +240,138 @@ def accessory_penalty(text: str) -> int:
 
 
 # ============================================================
-# Relevance Scoring
+# Compiled Query
 # ============================================================
 
-def relevance_score(query: str, product_name: str) -> float:
+class CompiledQuery:
     """
-    Compute relevance score between a search query
-    and a scraped product title.
-    """
-    score = 0.0
-
-    q_norm = normalize(query)
-    p_norm = normalize(product_name)
-
-    q_tokens = set(tokenize(q_norm)) - STOPWORDS
-    p_tokens = set(tokenize(p_norm)) - STOPWORDS
+    A search query analysed once (normalized text, tokens, model tokens,
+    base models, intent, threshold), to score many product names against.
 
-    q_models = extract_model_tokens(q_norm)
-    p_models = extract_model_tokens(p_norm)
-
-    series_query = is_series_query(query)
-
-    # --------------------------------------------------------
-    # 1. Exact model token match (strongest signal)
-    # --------------------------------------------------------
-    exact_matches = q_models & p_models
-    score += len(exact_matches) * 8
+    Each product name is normalized exactly once per score.
+    """
 
-    # --------------------------------------------------------
-    # 2. Base model (family) match (variant support)
-    # --------------------------------------------------------
-    for qm in q_models:
+    def __init__(self, query: str):
+        self.query = query
+        self.norm = normalize(query)
+
+        tokens = tokenize(self.norm)
+        self.tokens = set(tokens) - STOPWORDS
+        self.models = model_tokens(tokens)
+
+        # how many query models share each base model (one +6 per pair)
+        self.base_models: Dict[str, int] = {}
+        for qm in self.models:
+            base = base_model(qm)
+            self.base_models[base] = self.base_models.get(base, 0) + 1
+
+        # series query: no explicit model tokens, but a number ("seiko 5")
+        self.series = not self.models and any(t.isdigit() for t in tokens)
+        self.feature_tokens = self.tokens & FEATURE_KEYWORDS
+        self.threshold = self.recommended_threshold(set(tokens))
+
+    def recommended_threshold(self, tokens: Set[str]) -> float:
+        """See recommended_threshold."""
+        if self.models:
+            # User typed a specific model or model family
+            return 4.0
+
+        if self.series:
+            # Brand + line (e.g. "seiko 5")
+            return 2.5
+
+        if tokens & FEATURE_KEYWORDS:
+            # Feature-based discovery search
+            return 1.5
+
+        # Generic brand/category search
+        return 2.0
+
+    def score(self, product_name: str) -> float:
+        """
+        Compute relevance score between the query and a scraped product title.
+        """
+        score = 0.0
+
+        p_norm = normalize(product_name)
+        p_all_tokens = tokenize(p_norm)
+        p_token_set = set(p_all_tokens)
+        p_tokens = p_token_set - STOPWORDS
+        p_models = model_tokens(p_all_tokens)
+
+        # --------------------------------------------------------
+        # 1. Exact model token match (strongest signal)
+        # --------------------------------------------------------
+        score += len(self.models & p_models) * 8
+
+        # --------------------------------------------------------
+        # 2. Base model (family) match (variant support)
+        # --------------------------------------------------------
+        family_matches = 0
         for pm in p_models:
-            if base_model(qm) == base_model(pm):
-                score += 6
-
-    # --------------------------------------------------------
-    # 3. Wrong model family penalty (ONLY if model was specified)
-    # --------------------------------------------------------
-    if q_models and p_models and not series_query:
-        if not any(
-            base_model(qm) == base_model(pm)
-            for qm in q_models
-            for pm in p_models
-        ):
+            family_matches += self.base_models.get(base_model(pm), 0)
+        score += family_matches * 6
+
+        # --------------------------------------------------------
+        # 3. Wrong model family penalty (ONLY if model was specified)
+        # --------------------------------------------------------
+        if self.models and p_models and not self.series and not family_matches:
             score -= 4
 
-    # --------------------------------------------------------
-    # 4. Token overlap (weak signal)
-    # --------------------------------------------------------
-    score += len(q_tokens & p_tokens) * 0.5
+        # --------------------------------------------------------
+        # 4. Token overlap (weak signal)
+        # --------------------------------------------------------
+        score += len(self.tokens & p_tokens) * 0.5
+
+        # --------------------------------------------------------
+        # 5. Series phrase boost (e.g. "seiko 5")
+        # --------------------------------------------------------
+        if self.series:
+            if self.norm in p_norm:
+                score += 4
+
+        # --------------------------------------------------------
+        # 6. Feature phrase boost (e.g. "seiko 5")
+        # --------------------------------------------------------
+        if self.feature_tokens:
+            score += len(self.feature_tokens & p_tokens) * 3
+
+        # --------------------------------------------------------
+        # 7. Accessory penalty
+        # --------------------------------------------------------
+        score += normalized_accessory_penalty(p_token_set, p_norm)
+
+        return score
+
+    def score_all(self, product_names: List[str]) -> List[float]:
+        """Scores of a batch of product names."""
+        return [self.score(name) for name in product_names]
+
+    def matches(self, results: list) -> List[Tuple[float, object]]:
+        """
+        (rounded score, product) of the products that pass the threshold,
+        in their original order (products are not copied).
+        """
+        matches = []
+        for r in results:
+            s = self.score(r.name)
+            if s >= self.threshold:
+                matches.append((round(s, 2), r))
+        return matches
 
-    # --------------------------------------------------------
-    # 5. Series phrase boost (e.g. "seiko 5")
-    # --------------------------------------------------------
-    if series_query:
-        if q_norm in p_norm:
-            score += 4
 
-    # --------------------------------------------------------
-    # 6. Feature phrase boost (e.g. "seiko 5")
-    # --------------------------------------------------------
-    feature_tokens = q_tokens & FEATURE_KEYWORDS
-    if feature_tokens:
-        score += len(feature_tokens & p_tokens) * 3
+# ============================================================
+# Relevance Scoring
+# ============================================================
 
-    # --------------------------------------------------------
-    # 7. Accessory penalty
-    # --------------------------------------------------------
-    score += accessory_penalty(product_name)
+def relevance_score(query: str, product_name: str) -> float:
+    """
+    Compute relevance score between a search query
+    and a scraped product title.
 
-    return score
+    To score many products for the same query, use CompiledQuery.
+    """
+    return CompiledQuery(query).score(product_name)
 
 
 # ============================================================
@@ -312,47 +395,45 @@ def recommended_threshold(query: str) -> float:
     4) Generic brand search          -> low threshold
        e.g. "casio watches"
     """
+    return CompiledQuery(query).threshold
 
-    normalized = normalize(query)
-    tokens = set(tokenize(normalized))
-    models = extract_model_tokens(normalized)
-
-    # Feature intent (solar, automatic, diver, etc.)
-    feature_intent = bool(tokens & FEATURE_KEYWORDS)
 
-    # Series / line intent (numeric but no explicit model)
-    series_intent = is_series_query(query)
+# ============================================================
+# Result Filtering
+# ============================================================
 
-    if models:
-        # User typed a specific model or model family
-        return 4.0
+def filter_results(query, results, top_k=None):
+    """
+    Score, filter, and sort scraped results.
 
-    if series_intent:
-        # Brand + line (e.g. "seiko 5")
-        return 2.5
+    top_k: only keep the k best matches (heap selection instead of a full sort).
+    """
+    return top_results(CompiledQuery(query).matches(results), top_k)
 
-    if feature_intent:
-        # Feature-based discovery search
-        return 1.5
 
-    # Generic brand/category search
-    return 2.0
+def top_results(matches, top_k=None):
+    """
+    Best matches first, as product copies with their score; only the kept
+    ones are copied.
+    """
+    if top_k is None:
+        best = sorted(matches, key=itemgetter(0), reverse=True)
+    else:
+        # same order as the full sort, cut at k
+        best = heapq.nlargest(top_k, matches, key=itemgetter(0))
 
+    return [replace(r, score=s) for s, r in best]
 
-# ============================================================
-# Result Filtering
-# ============================================================
 
-def filter_results(query, results):
+def cheapest_match(query, results):
     """
-    Score, filter, and sort scraped results.
+    "Min price only" mode: the cheapest product that passes the threshold
+    (None if none does), without copying or sorting anything.
     """
-    threshold = recommended_threshold(query)
-    scored = []
+    return cheapest(CompiledQuery(query).matches(results))
+
 
-    for r in results:
-        s = relevance_score(query, r["name"])
-        if s >= threshold:
-            scored.append({**r, "score": round(s, 2)})
+def cheapest(matches):
+    """The cheapest result of (score, result) matches (None if there are none)."""
+    return min((r for _, r in matches), key=attrgetter("price"), default=None)
 
-    return sorted(scored, key=lambda x: x["score"], reverse=True)
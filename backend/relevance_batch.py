@@ -0,0 +1,205 @@
+"""
+Batch relevance scoring for bulk sweeps (many terms x many listings).
+
+Product names are normalized and tokenized once into a shared vocabulary;
+every signal of relevance_score (exact model, base model family, wrong
+family, token overlap, series phrase, features, accessories) is then
+computed for all queries x all products at once with matrix products.
+
+numpy is required (scipy is used for sparse matrices when installed);
+without numpy, filter_results_many falls back to CompiledQuery.
+"""
+from typing import Dict, List
+from backend.relevance import (
+    STOPWORDS,
+    CompiledQuery,
+    base_model,
+    filter_results,
+    model_tokens,
+    normalize,
+    normalized_accessory_penalty,
+    tokenize,
+    top_results,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+
+class Vocabulary:
+    """Column index per token, assigned on first sight."""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+
+    def add(self, token: str) -> int:
+        return self.index.setdefault(token, len(self.index))
+
+    def __len__(self):
+        return len(self.index)
+
+
+def incidence(rows: List[Dict[int, int]], columns: int):
+    """
+    Rows x columns count matrix from one {column: count} dict per row
+    (scipy CSR when available, dense numpy otherwise).
+    """
+    row_ids, col_ids, counts = [], [], []
+    for row, cells in enumerate(rows):
+        for col, count in cells.items():
+            row_ids.append(row)
+            col_ids.append(col)
+            counts.append(count)
+
+    shape = (len(rows), max(columns, 1))
+    if sparse is not None:
+        return sparse.csr_matrix(
+            (np.array(counts, dtype=np.float64), (row_ids, col_ids)), shape=shape)
+
+    matrix = np.zeros(shape)
+    matrix[row_ids, col_ids] = counts
+    return matrix
+
+
+def product(left, right) -> "np.ndarray":
+    """Dense left @ right.T (sparse or dense inputs)."""
+    result = left @ right.T
+    return result.toarray() if sparse is not None and sparse.issparse(result) else np.asarray(result)
+
+
+class BatchScorer:
+    """
+    Product names analysed once, to be scored against many queries.
+
+    scores(queries) returns a queries x products array equal to
+    [[relevance_score(q, name) for name in names] for q in queries].
+    """
+
+    def __init__(self, product_names: List[str]):
+        if np is None:
+            raise ImportError("BatchScorer requires numpy")
+
+        self.tokens = Vocabulary()
+        self.models = Vocabulary()
+        self.bases = Vocabulary()
+
+        token_rows, model_rows, base_rows = [], [], []
+        norms, penalties, has_models = [], [], []
+
+        for name in product_names:
+            p_norm = normalize(name)
+            p_all_tokens = tokenize(p_norm)
+            p_token_set = set(p_all_tokens)
+            p_models = model_tokens(p_all_tokens)
+
+            token_rows.append(
+                {self.tokens.add(t): 1 for t in p_token_set - STOPWORDS})
+            model_rows.append({self.models.add(m): 1 for m in p_models})
+
+            bases: Dict[int, int] = {}
+            for m in p_models:
+                col = self.bases.add(base_model(m))
+                bases[col] = bases.get(col, 0) + 1
+            base_rows.append(bases)
+
+            norms.append(p_norm)
+            penalties.append(normalized_accessory_penalty(p_token_set, p_norm))
+            has_models.append(bool(p_models))
+
+        self.count = len(product_names)
+        self.token_matrix = incidence(token_rows, len(self.tokens))
+        self.model_matrix = incidence(model_rows, len(self.models))
+        self.base_matrix = incidence(base_rows, len(self.bases))
+        self.norms = np.array(norms, dtype=str)
+        self.penalties = np.array(penalties, dtype=np.float64)
+        self.has_models = np.array(has_models, dtype=bool)
+
+    def compile(self, queries: List[str]):
+        """Query-side matrices over the products' vocabulary."""
+        compiled = [CompiledQuery(q) for q in queries]
+
+        def columns(vocabulary: Vocabulary, items) -> Dict[int, int]:
+            return {vocabulary.index[t]: 1 for t in items if t in vocabulary.index}
+
+        token_rows = [columns(self.tokens, q.tokens) for q in compiled]
+        feature_rows = [columns(self.tokens, q.feature_tokens) for q in compiled]
+        model_rows = [columns(self.models, q.models) for q in compiled]
+        base_rows = [
+            {self.bases.index[b]: n for b, n in q.base_models.items() if b in self.bases.index}
+            for q in compiled
+        ]
+
+        return compiled, {
+            "tokens": incidence(token_rows, len(self.tokens)),
+            "features": incidence(feature_rows, len(self.tokens)),
+            "models": incidence(model_rows, len(self.models)),
+            "bases": incidence(base_rows, len(self.bases)),
+        }
+
+    def scores(self, queries: List[str]) -> "np.ndarray":
+        compiled, matrices = self.compile(queries)
+
+        # 1. exact model token matches, 2. base model (family) pairs
+        exact = product(matrices["models"], self.model_matrix)
+        family = product(matrices["bases"], self.base_matrix)
+        # 4. token overlap, 6. feature tokens the product mentions
+        overlap = product(matrices["tokens"], self.token_matrix)
+        features = product(matrices["features"], self.token_matrix)
+
+        q_has_models = np.array([bool(q.models) for q in compiled], dtype=bool)
+        series = np.array([q.series for q in compiled], dtype=bool)
+
+        # 3. wrong model family penalty (only if a model was specified)
+        wrong_family = (
+            q_has_models[:, None]
+            & self.has_models[None, :]
+            & ~series[:, None]
+            & (family == 0)
+        )
+
+        # 5. series phrase boost (only series queries need the substring test)
+        phrase = np.zeros((len(compiled), self.count), dtype=bool)
+        for row, q in enumerate(compiled):
+            if q.series and self.count:
+                phrase[row] = np.char.find(self.norms, q.norm) >= 0
+
+        return (
+            exact * 8
+            + family * 6
+            - wrong_family * 4
+            + overlap * 0.5
+            + phrase * 4
+            + features * 3
+            # 7. accessory penalty (product only)
+            + self.penalties[None, :]
+        )
+
+
+def filter_results_many(queries: List[str], results: list) -> List[list]:
+    """
+    filter_results for many queries over the same scraped results:
+    [filter_results(q, results) for q in queries], scored in one batch.
+    """
+    if np is None or not results:
+        return [filter_results(q, results) for q in queries]
+
+    scorer = BatchScorer([r.name for r in results])
+    scores = scorer.scores(queries)
+    filtered = []
+
+    for query, row in zip(queries, scores):
+        threshold = CompiledQuery(query).threshold
+        matches = [
+            (round(float(row[i]), 2), results[i])
+            for i in np.flatnonzero(row >= threshold)
+        ]
+        filtered.append(top_results(matches))
+
+    return filtered
@@ -0,0 +1,122 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+
+class SchedulerFull(Exception):
+    """Raised when a scrape can't be admitted (queue full or it would wait too long)."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Too many searches in progress")
+        self.retry_after = retry_after
+
+
+class ScrapeScheduler:
+    """
+    Admission control in front of the scrapers.
+
+    - a global limit on concurrent browser pages (sized with the BrowserPool)
+    - a per-domain limit, so we stay polite with each retailer
+    - a bounded queue: when it's full, or when the estimated wait (from the
+      average scrape duration) exceeds `max_wait`, the scrape is rejected
+      right away with SchedulerFull instead of piling up
+    """
+
+    def __init__(self, browser_slots: int = 4, per_domain: int = 2, max_queue: int = 32, max_wait: float = 30):
+        self.browser_slots = browser_slots
+        self.per_domain = per_domain
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+
+        self._browser = asyncio.Semaphore(browser_slots)
+        self._domains: dict[str, asyncio.Semaphore] = {}
+
+        self.waiting = 0
+        self.running = 0
+        self.rejected = 0
+        # moving average of how long a scrape holds its slot (seconds)
+        self.avg_duration = 5.0
+
+    @asynccontextmanager
+    async def slot(self, domain: str, uses_browser: bool, max_wait: float | None = None):
+        """Hold a scrape slot for `domain` (and a browser page if `uses_browser`)."""
+        max_wait = self.max_wait if max_wait is None else max_wait
+        self._admit(max_wait)
+
+        deadline = time.monotonic() + max_wait
+        domain_slot = self._domains.setdefault(
+            domain, asyncio.Semaphore(self.per_domain))
+
+        self.waiting += 1
+        acquired = []
+        try:
+            # domain first, so a browser page isn't held while waiting on politeness
+            for semaphore in (domain_slot, self._browser if uses_browser else None):
+                if semaphore is None:
+                    continue
+                await asyncio.wait_for(semaphore.acquire(), timeout=max(deadline - time.monotonic(), 0))
+                acquired.append(semaphore)
+        except BaseException as e:
+            # timed out or cancelled while queued: give back what we got
+            for semaphore in acquired:
+                semaphore.release()
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected += 1
+                raise SchedulerFull(self._retry_after())
+            raise
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.running -= 1
+            self.avg_duration = 0.8 * self.avg_duration + \
+                0.2 * (time.monotonic() - started)
+            for semaphore in acquired:
+                semaphore.release()
+
+    @asynccontextmanager
+    async def browser_slot(self, max_wait: float | None = None):
+        """
+        Hold a browser page for a scrape admitted without one (HTTP-first
+        scrapers falling back to their page), with the same admission rules
+        as slot(). Its domain slot is already held by slot().
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        self._admit(max_wait)
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._browser.acquire(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise SchedulerFull(self._retry_after())
+        finally:
+            self.waiting -= 1
+
+        try:
+            yield
+        finally:
+            self._browser.release()
+
+    def stats(self) -> dict:
+        return {
+            "waiting": self.waiting,
+            "running": self.running,
+            "rejected": self.rejected,
+            "avg_duration": round(self.avg_duration, 3),
+        }
+
+    def _admit(self, max_wait: float):
+        estimated_wait = self.waiting / self.browser_slots * self.avg_duration
+
+        if self.waiting >= self.max_queue or estimated_wait > max_wait:
+            self.rejected += 1
+            raise SchedulerFull(self._retry_after())
+
+    def _retry_after(self) -> int:
+        # roughly the time for the current queue to drain
+        return max(1, round(self.waiting / self.browser_slots * self.avg_duration))
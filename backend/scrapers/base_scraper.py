@@ -1,11 +1,162 @@
-from abc import ABC, abstractmethod
+import time
+from abc import ABC
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import dataclass
+from urllib.parse import quote
+from .request_filter import RequestFilter
+from .extraction import ExtractionSpec, EXTRACT_JS, to_js, to_products
+from .parsing import compile_spec, parse_products
+from ..workers import INLINE
+from .. import tracing
+from ..product import Product
+
+
+# ms to get a search page's response (page.goto only waits for the commit)
+PAGE_LOAD_TIMEOUT = 20000
+# ms from the navigation commit until a search page is ready: the load plus 5s
+# for the grid, under the app's per-retailer fan-out timeout (30s by default)
+READINESS_TIMEOUT = PAGE_LOAD_TIMEOUT + 5000
+
+
+@dataclass(frozen=True)
+class Readiness:
+    """
+    When a Playwright search page is ready to be read.
+
+    - results: selector that appears once the product grid is rendered
+    - no_results: selector of the retailer's "no results" message; without one,
+      the grid must be in the server-rendered HTML, and a page whose DOM has
+      loaded without it has no results
+    - timeout: max wait in ms from the navigation commit, so it covers the page
+      load too
+    """
+    results: str
+    no_results: str | None = None
+    timeout: float = READINESS_TIMEOUT
+
+
+async def wait_until_ready(target, readiness: Readiness) -> bool:
+    """
+    Wait on a page or frame until the results or the no-results marker shows
+    (or, for retailers without a marker, until the DOM has loaded).
+    Returns True when there are results to read, False when there are none.
+
+    Raises Playwright's TimeoutError when the page wasn't ready in time: a slow
+    or broken page is a failed scrape (not cached), not an empty result.
+    """
+    if readiness.no_results:
+        selector = readiness.results + ", " + readiness.no_results
+        await target.wait_for_selector(selector, timeout=readiness.timeout)
+    else:
+        # server-rendered grid: it's there once the document is parsed, or never
+        await target.wait_for_load_state("domcontentloaded", timeout=readiness.timeout)
+
+    return await target.locator(readiness.results).count() > 0
 
 
 class BaseScraper(ABC):
-    @abstractmethod
-    async def scrape(self, url: str, term: str) -> list[dict]:
+    # retailer search page, with a {term} placeholder (mirrors static/retailers.js)
+    search_url: str = ""
+    # currency of the retailer's prices (None: unknown or mixed, e.g. eBay listings)
+    currency: str | None = None
+    # Playwright scrapers hold a browser page while scraping (counted by the scheduler)
+    uses_browser: bool = False
+    # requests Playwright scrapers skip (images, fonts, trackers, third-party scripts)
+    request_filter: RequestFilter = RequestFilter()
+    # when a Playwright search page is ready (see open_search_page)
+    readiness: Readiness | None = None
+    # where the products are on a search page (see extract / parse_html)
+    extraction: ExtractionSpec | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # compile the retailer's selectors once, at import
+        if cls.extraction is not None:
+            compile_spec(cls.extraction)
+
+    def __init__(self, browser_pool=None, http_client=None, executor=None, browser_slot=None):
+        # shared BrowserPool owned by the app (only used by Playwright scrapers)
+        self.browser_pool = browser_pool
+        # shared HttpClient owned by the app (only used by HTTP scrapers)
+        self.http_client = http_client
+        # shared CpuExecutor owned by the app, for CPU-bound work like HTML parsing
+        self.executor = executor or INLINE
+        # scheduler browser slot (async context manager factory) for scrapers admitted
+        # without one (uses_browser = False) that fall back to a page
+        self.browser_slot = browser_slot
+        # seconds spent in each stage of the last scrape (navigation, readiness, ...)
+        self.timings: dict[str, float] = {}
+
+    @classmethod
+    def build_search_url(cls, term: str) -> str:
+        """Build this retailer's search URL for a term (URL-encoded like encodeURIComponent)."""
+        return cls.search_url.format(term=quote(term, safe="!'()*"))
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a stage of the scrape into self.timings (and a trace span, when tracing is on)."""
+        started = time.perf_counter()
+        try:
+            with tracing.span(name, scraper=type(self).__name__):
+                yield
+        finally:
+            self.timings[name] = self.timings.get(
+                name, 0) + time.perf_counter() - started
+
+    @asynccontextmanager
+    async def browser_page(self):
+        """A pooled browser page, once the scheduler grants it (see browser_slot)."""
+        async with self.browser_slot() if self.browser_slot else nullcontext():
+            async with self.browser_pool.page(self.request_filter) as page:
+                yield page
+
+    async def open_search_page(self, page, url: str) -> bool:
         """
-        Scrapes the given URL and returns a list of products:
-        [{"name": str, "price": float}, ...]
+        Navigate to the search page and return as soon as it is ready
+        (per self.readiness) instead of waiting for load / networkidle.
+        Returns True when there are results to read (see wait_until_ready).
         """
-        pass
+        with self.stage("navigation"):
+            # don't wait for the load event, the readiness selector decides
+            await page.goto(url, wait_until="commit", timeout=PAGE_LOAD_TIMEOUT)
+
+        with self.stage("readiness"):
+            return await wait_until_ready(page, self.readiness)
+
+    async def extract(self, target, spec: ExtractionSpec) -> list[Product]:
+        """
+        Read the products off a page or frame with a single in-page script
+        (no page.content() serialization / re-parse, no per-item round trips).
+        """
+        with self.stage("extraction"):
+            records = await target.evaluate(EXTRACT_JS, to_js(spec))
+
+        with self.stage("parse"):
+            return to_products(records, spec)
+
+    async def parse_html(self, html: str, spec: ExtractionSpec) -> list[Product]:
+        """
+        Read the products off an HTML document fetched over HTTP, with the
+        configured parser (see parsing.HTML_PARSER), in the CPU executor.
+        """
+        with self.stage("parse"):
+            return await self.executor.run(parse_products, html, spec)
+
+    async def scrape(self, url: str, term: str) -> list[Product]:
+        """
+        Scrapes the given URL and returns the products found (in stock only).
+        By default, reads the search page in a browser (scrape_page).
+        """
+        return await self.scrape_page(url, term)
+
+    async def scrape_page(self, url: str, term: str) -> list[Product]:
+        """
+        Read the search page in a pooled browser page: wait for
+        self.readiness, then read self.extraction off the page.
+        """
+        async with self.browser_page() as page:
+            # return as soon as the product grid (or no-results message) shows
+            if not await self.open_search_page(page, url):
+                return []
+
+            return await self.extract(page, self.extraction)
@@ -0,0 +1,170 @@
+import asyncio
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright, Browser, Page, Route
+from .request_filter import RequestFilter, site_of
+from .origins import ORIGIN_OVERRIDES, rewrite
+
+
+class _PooledBrowser:
+    """A warm Chromium instance plus the bookkeeping the pool needs to recycle it."""
+
+    def __init__(self, browser: Browser):
+        self.browser = browser
+        self.uses = 0
+        self.active = 0
+
+    def is_healthy(self) -> bool:
+        return self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    Process-wide pool of warm Chromium instances.
+
+    Scrapers ask for a page with `async with pool.page() as page:` and get a
+    fresh, isolated browser context on one of the pooled browsers. The number of
+    concurrently open pages is bounded, dead browsers are replaced, and each
+    browser is recycled after `max_uses` pages to keep memory in check.
+    """
+
+    def __init__(self, size: int = 1, max_pages: int = 4, max_uses: int = 100, headless: bool = True):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_uses = max_uses
+        self.headless = headless
+        # extra browser context options (e.g. record_har_path when recording fixtures)
+        self.context_options: dict = {}
+
+        self._playwright = None
+        self._browsers: list[_PooledBrowser] = []
+        self._pages = asyncio.Semaphore(max_pages)
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        self._playwright = await async_playwright().start()
+        for _ in range(self.size):
+            self._browsers.append(await self._launch())
+
+    async def stop(self):
+        for pooled in self._browsers:
+            await self._close(pooled)
+        self._browsers = []
+
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    @asynccontextmanager
+    async def page(self, request_filter: RequestFilter | None = None):
+        """
+        Yield a page in its own browser context; the context is closed on exit.
+        With a `request_filter`, unneeded requests are aborted before they're sent.
+        """
+        async with self._pages:
+            pooled = await self._acquire()
+            try:
+                context = await pooled.browser.new_context(**self.context_options)
+                try:
+                    # routes added last run first: the request filter, then the overrides
+                    if ORIGIN_OVERRIDES:
+                        await install_origin_overrides(context)
+                    if request_filter:
+                        await install_request_filter(context, request_filter)
+                    page: Page = await context.new_page()
+                    yield page
+                finally:
+                    await context.close()
+            finally:
+                await self._release(pooled)
+
+    @property
+    def pages_in_use(self) -> int:
+        return sum(pooled.active for pooled in self._browsers)
+
+    async def _launch(self) -> _PooledBrowser:
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+        return _PooledBrowser(browser)
+
+    async def _close(self, pooled: _PooledBrowser):
+        try:
+            await pooled.browser.close()
+        except Exception:
+            # the browser may already be gone (crash / killed by the OS)
+            pass
+
+    async def _acquire(self) -> _PooledBrowser:
+        async with self._lock:
+            # health check: replace browsers that crashed or were disconnected
+            for i, pooled in enumerate(self._browsers):
+                if not pooled.is_healthy():
+                    await self._close(pooled)
+                    self._browsers[i] = await self._launch()
+
+            # least loaded browser that hasn't reached its use limit
+            candidates = [
+                pooled for pooled in self._browsers if pooled.uses < self.max_uses]
+
+            if not candidates:
+                # every browser is retiring; start an extra one until they drain
+                pooled = await self._launch()
+                self._browsers.append(pooled)
+                candidates = [pooled]
+
+            pooled = min(candidates, key=lambda b: b.active)
+            pooled.uses += 1
+            pooled.active += 1
+            return pooled
+
+    async def _release(self, pooled: _PooledBrowser):
+        async with self._lock:
+            pooled.active -= 1
+
+            # recycle browsers that reached their use limit once they are idle
+            # (unless the health check already replaced and closed it)
+            if pooled.uses >= self.max_uses and pooled.active == 0 and pooled in self._browsers:
+                self._browsers.remove(pooled)
+                await self._close(pooled)
+                if len(self._browsers) < self.size:
+                    self._browsers.append(await self._launch())
+
+
+async def install_request_filter(context, request_filter: RequestFilter):
+    """
+    Abort the requests `request_filter` blocks for every page of `context`.
+    The retailer's own site is taken from the first main-frame navigation.
+    """
+    site = None
+
+    async def handle(route: Route):
+        nonlocal site
+        request = route.request
+
+        if site is None and request.resource_type == "document":
+            site = site_of(urlparse(request.url).hostname or "")
+
+        if request_filter.should_block(request.resource_type, request.url, site):
+            await route.abort()
+        else:
+            # on to the origin overrides, if any (otherwise sent as is)
+            await route.fallback()
+
+    await context.route("**/*", handle)
+
+
+async def install_origin_overrides(context):
+    """
+    Serve every request of `context` from its replacement origin
+    (see origins.ORIGIN_OVERRIDES); requests to other origins are aborted,
+    so an offline run never reaches the live sites.
+    """
+    async def handle(route: Route):
+        url = rewrite(route.request.url)
+        if url == route.request.url:
+            await route.abort()
+            return
+
+        response = await route.fetch(url=url)
+        await route.fulfill(response=response)
+
+    await context.route("**/*", handle)
@@ -1,34 +1,14 @@
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-from .base_scraper import BaseScraper
-from .utils import normalize_price
+from .base_scraper import BaseScraper, Readiness
+from .extraction import ExtractionSpec
 
 
 class CanadaWatchHouseScraper(BaseScraper):
-    async def scrape(self, url: str, term: str) -> list[dict]:
-        products = []
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto(url, wait_until="networkidle")
-
-            content = await page.content()
-            soup = BeautifulSoup(content, "html.parser")
-
-            # Example parsing logic: adapt selectors to actual site
-            product_elements = soup.select(
-                "#product-loop .product-index")  # adjust selector
-
-            for el in product_elements:
-                name_el = el.select_one(".product-info a h3")
-                price_el = el.select_one(".product-info .price span.money")
-
-                if name_el and price_el:
-                    name = name_el.get_text(strip=True)
-                    price = normalize_price(price_el.get_text(strip=True))
-                    products.append({"name": name, "price": price})
-
-            await browser.close()
-
-        return products
+    search_url = "https://canadawatchhouse.ca/search?q={term}"
+    currency = "CAD"
+    uses_browser = True
+    readiness = Readiness(results="#product-loop .product-index")
+    extraction = ExtractionSpec(
+        item="#product-loop .product-index",
+        name=".product-info a h3",
+        price=(".product-info .price span.money",),
+    )
@@ -1,52 +1,30 @@
-import requests
-from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
-from .utils import normalize_price
+from .extraction import ExtractionSpec
+from ..product import Product
 
 
 class EbayHttpScraper(BaseScraper):
-    async def scrape(self, url: str, term: str) -> list[dict]:
+    search_url = "https://www.ebay.ca/sch/i.html?_nkw={term}"
+    extraction = ExtractionSpec(
+        # only the result list is parsed / searched
+        scope="ul.srp-results",
+        item="ul.srp-results>li",
+        name=".su-card-container__header .s-card__link .s-card__title span.primary",
+        price=(".su-card-container__attributes span.s-card__price",),
+    )
+
+    async def scrape(self, url: str, term: str) -> list[Product]:
         """
         Scrape eBay search results via direct HTTP requests (no browser).
 
-        Returns a list of dicts: [{"name": str, "price": float}]
+        Returns a list of Product
         """
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept-Language": "en-CA,en;q=0.9",
-        }
-
-        # Make HTTP GET request
-        resp = requests.get(url, headers=headers, timeout=15)
+        # Make HTTP GET request through the shared connection pool
+        with self.stage("fetch"):
+            resp = await self.http_client.get(url, timeout=15)
         resp.raise_for_status()  # raise error if non-200
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        products = []
-
-        # Each search item
-        for el in soup.select("ul.srp-results>li"):
-            name_el = el.select_one(
-                ".su-card-container__header .s-card__link .s-card__title span.primary")
-            price_el = el.select_one(
-                ".su-card-container__attributes span.s-card__price")
-
-            if name_el and price_el:
-                name_text = name_el.get_text(strip=True)
-
-                # eBay sometimes includes "New Listing" as text
-                if name_text.lower() == "new listing":
-                    # skip this element
-                    continue
-
-                price_text = price_el.get_text(strip=True)
-                price = normalize_price(price_text)
-
-                if price is not None:
-                    products.append({"name": name_text, "price": price})
+        products = await self.parse_html(resp.text, self.extraction)
 
-        return products
+        # eBay sometimes includes "New Listing" as text
+        return [p for p in products if p.name.lower() != "new listing"]
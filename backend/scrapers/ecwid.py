@@ -0,0 +1,35 @@
+from ..product import Product
+
+ECWID_API_URL = "https://app.ecwid.com/api/v3/{store_id}/products"
+
+
+async def search(http_client, store_id: str, token: str, term: str, limit: int = 100) -> list[Product]:
+    """
+    Query the Ecwid REST API directly (with the store's public token) and
+    return in-stock products.
+    """
+    resp = await http_client.get(
+        ECWID_API_URL.format(store_id=store_id),
+        params={
+            "keyword": term,
+            "enabled": "true",
+            "inStock": "true",
+            "limit": limit,
+            "responseFields": "items(name,price,defaultDisplayedPrice,inStock,url)",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    resp.raise_for_status()
+
+    products = []
+    for item in resp.json()["items"]:
+        if not item.get("inStock", True):
+            continue
+
+        # the price shown in the store grid (includes sale / default options)
+        price = item.get("defaultDisplayedPrice") or item.get("price")
+        if item.get("name") and price:
+            products.append(Product(
+                name=item["name"].strip(), price=float(price), url=item.get("url")))
+
+    return products
@@ -0,0 +1,97 @@
+from dataclasses import dataclass, asdict
+from .utils import normalize_price
+from ..product import Product
+
+
+@dataclass(frozen=True)
+class ExtractionSpec:
+    """
+    Where a retailer's products are on its search page.
+
+    - item: selector of each product card
+    - name: selector of the product name inside a card
+    - price: price selectors inside a card, in order of preference
+    - remove: elements to drop from a price element before reading it
+      (first match of each, e.g. the struck-through old price or a badge)
+    - out_of_stock: cards matching this selector are out of stock
+    - price_mode: "first" uses the first price found, "min" the lowest non-zero one
+    - scope: selector of the results container; HTML parsers only need to
+      build / search that part of the document
+    - exclude_text: cards whose text contains one of these (lowercase) are skipped
+    """
+    item: str
+    name: str
+    price: tuple[str, ...]
+    remove: tuple[str, ...] = ()
+    out_of_stock: str | None = None
+    price_mode: str = "first"
+    scope: str | None = None
+    exclude_text: tuple[str, ...] = ()
+
+
+# Runs inside the page: one compact record per card, read in a single round trip
+EXTRACT_JS = """
+(spec) => {
+    const text = (el) => (el ? el.textContent.replace(/\\s+/g, " ").trim() : "");
+
+    const root = spec.scope ? document.querySelector(spec.scope) : document;
+    if (!root) return [];
+
+    const cards = Array.from(root.querySelectorAll(spec.item)).filter((card) => {
+        const cardText = card.textContent.toLowerCase();
+        return !spec.exclude_text.some((unwanted) => cardText.includes(unwanted));
+    });
+
+    return cards.map((card) => {
+        const prices = [];
+        for (const selector of spec.price) {
+            const el = card.querySelector(selector);
+            if (!el) continue;
+
+            const clone = el.cloneNode(true);
+            for (const unwanted of spec.remove) {
+                const match = clone.querySelector(unwanted);
+                if (match) match.remove();
+            }
+            prices.push(text(clone));
+        }
+
+        return {
+            name: text(card.querySelector(spec.name)),
+            prices: prices,
+            in_stock: !(spec.out_of_stock && card.matches(spec.out_of_stock)),
+        };
+    });
+}
+"""
+
+
+def to_js(spec: ExtractionSpec) -> dict:
+    """Spec as the JSON argument of EXTRACT_JS."""
+    return asdict(spec)
+
+
+def to_products(records: list[dict], spec: ExtractionSpec) -> list[Product]:
+    """
+    Turn extracted records ({name, prices, in_stock}) into in-stock products.
+    """
+    products = []
+
+    for record in records:
+        if not record["in_stock"] or not record["name"] or not record["prices"]:
+            continue
+
+        prices = [normalize_price(text) for text in record["prices"]]
+
+        if spec.price_mode == "min":
+            # lowest available price (e.g. regular vs "with code" price)
+            prices = [price for price in prices if price]
+            if not prices:
+                continue
+            price = min(prices)
+        else:
+            price = prices[0]
+
+        products.append(Product(name=record["name"], price=price))
+
+    return products
@@ -0,0 +1,60 @@
+import asyncio
+from urllib.parse import urlparse
+import httpx
+from .origins import rewrite
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-CA,en;q=0.9",
+}
+
+
+class HttpClient:
+    """
+    Shared asyncio HTTP client for the browser-free scrapers.
+
+    Wraps one httpx.AsyncClient so every scraper reuses the same pool of
+    keep-alive connections (HTTP/2 when the server supports it, so repeated
+    searches against a retailer skip the DNS lookup and TCP/TLS handshake).
+    Requests to the same host are additionally capped by `per_host` so one
+    busy retailer can't take the whole connection pool.
+    """
+
+    def __init__(self, max_connections: int = 50, per_host: int = 6, keepalive_expiry: float = 30.0):
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.keepalive_expiry = keepalive_expiry
+
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+
+    async def start(self):
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+
+    async def stop(self):
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, url: str, headers: dict | None = None, timeout: float = 15, **kwargs) -> httpx.Response:
+        """GET a URL through the shared connection pool."""
+        url = rewrite(url)
+        host = urlparse(url).netloc
+        slot = self._host_slots.setdefault(host, asyncio.Semaphore(self.per_host))
+
+        async with slot:
+            return await self._client.get(url, headers=headers, timeout=timeout, **kwargs)
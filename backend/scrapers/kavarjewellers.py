@@ -1,57 +1,70 @@
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-from .base_scraper import BaseScraper
-from .utils import normalize_price
+import os
+import httpx
+from .base_scraper import PAGE_LOAD_TIMEOUT, BaseScraper, Readiness, wait_until_ready
+from .extraction import ExtractionSpec
+from . import ecwid
+from .request_filter import RESOURCES_ONLY
+from ..product import Product
 
 
 class KavarJewellersScraper(BaseScraper):
-    async def scrape(self, url: str, term: str) -> list[dict]:
-        products = []
+    search_url = "https://www.kavarjewellers.ca/collections/search%3Fkeyword%3D{term}"
+    currency = "CAD"
+    # the Ecwid API path doesn't need a browser page; the page fallback
+    # takes a scheduler browser slot first (see BaseScraper.browser_page)
+    uses_browser = False
+    # Wix page with an Ecwid store iframe: both need their third-party scripts
+    request_filter = RESOURCES_ONLY
+    # product grid inside the Ecwid store iframe (timed from when the iframe is attached)
+    readiness = Readiness(
+        results=".grid-product",
+        no_results="div.ec-search--no-products",
+        timeout=5000,
+    )
+    extraction = ExtractionSpec(
+        # in-stock items only
+        item=".grid-product:not(.ec-store-productsGrid-cell-outOfStock)",
+        name="a.grid-product__title .grid-product__title-inner",
+        price=(".grid-product__price .grid-product__price-value",),
+    )
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+    async def scrape(self, url: str, term: str) -> list[Product]:
+        # the Ecwid API needs the store id and its public token (see README)
+        store_id = os.getenv("KAVAR_ECWID_STORE_ID")
+        token = os.getenv("KAVAR_ECWID_TOKEN")
 
-            # for this Wix sites that loads the product grid in an iframe
-            await page.goto(url)
-            # we need to wait for the iframe if the products grid to load
-            await page.wait_for_selector('iframe[title="Online Store"]')
-            # get all iframes
-            iframes = await page.query_selector_all('iframe[title="Online Store"]')
-            # we need the third one
-            iframe_element = iframes[2]
-            # Get the iframe’s Frame object
-            frame = await iframe_element.content_frame()
-
-            # Wait for products inside the iframe (or the not-result div)
-            await frame.wait_for_selector(".grid-product,div.ec-search--no-products", timeout=10000)
-
-            # if there's no results, return empty
-            if await frame.locator("div.ec-search--no-products").count() > 0:
-                return []
+        if store_id and token:
+            try:
+                with self.stage("fetch"):
+                    return await ecwid.search(self.http_client, store_id, token, term)
+            except (httpx.HTTPError, ValueError, KeyError, TypeError):
+                # API unreachable / token revoked: render the store page
+                pass
 
-            # get in-stock items
-            items = frame.locator(
-                ".grid-product:not(.ec-store-productsGrid-cell-outOfStock)")
-            count = await items.count()
+        return await self.scrape_page(url, term)
 
-            for i in range(count):
-                item = items.nth(i)
-
-                name = await item.locator(
-                    "a.grid-product__title .grid-product__title-inner"
-                ).inner_text()
+    async def scrape_page(self, url: str, term: str) -> list[Product]:
+        async with self.browser_page() as page:
+            # for this Wix sites that loads the product grid in an iframe
+            with self.stage("navigation"):
+                await page.goto(url, wait_until="commit", timeout=PAGE_LOAD_TIMEOUT)
 
-                price = await item.locator(
-                    ".grid-product__price .grid-product__price-value"
-                ).inner_text()
+            with self.stage("readiness"):
+                # the store is the third "Online Store" iframe: wait until that one
+                # is attached (not just the first, the page is still loading)
+                store = page.locator('iframe[title="Online Store"]').nth(2)
+                await store.wait_for(state="attached", timeout=PAGE_LOAD_TIMEOUT)
+                # Get the iframe’s Frame object
+                frame = await (await store.element_handle()).content_frame()
+                if frame is None:
+                    raise RuntimeError("Online Store iframe has no frame")
 
-                if name and price:
-                    products.append({
-                        "name": name.strip(),
-                        "price": normalize_price(price)
-                    })
+                # Wait for products inside the iframe (or the not-result div)
+                ready = await wait_until_ready(frame, self.readiness)
 
-            await browser.close()
+            # if there's no results, return empty
+            if not ready:
+                return []
 
-        return products
+            # read every in-stock grid item in one go inside the iframe
+            return await self.extract(frame, self.extraction)
@@ -0,0 +1,28 @@
+import json
+import os
+from urllib.parse import urlsplit
+
+# live origin -> replacement origin, e.g. {"https://www.ebay.ca": "http://127.0.0.1:8101"},
+# to run the scrapers against local stand-ins (offline benchmarks)
+ORIGIN_OVERRIDES: dict[str, str] = json.loads(
+    os.getenv(key="ORIGIN_OVERRIDES", default="") or "{}")
+
+
+def origin_of(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def rewrite(url: str) -> str:
+    """The URL on its replacement origin (unchanged when it has none)."""
+    origin = origin_of(url)
+    replacement = ORIGIN_OVERRIDES.get(origin)
+    if replacement is None:
+        return url
+    return replacement + url[len(origin):]
+
+
+def set_overrides(overrides: dict[str, str]):
+    """Replace the origin overrides for this process."""
+    ORIGIN_OVERRIDES.clear()
+    ORIGIN_OVERRIDES.update(overrides)
@@ -0,0 +1,274 @@
+import os
+import re
+from .extraction import ExtractionSpec, to_products
+from ..product import Product
+
+# HTML engine used by the HTTP scrapers: auto, selectolax, lxml or bs4
+# (auto picks the fastest one installed)
+HTML_PARSER = os.getenv(key="HTML_PARSER", default="auto")
+
+# tag, #id and .class parts of a simple selector (SoupStrainer scopes)
+SIMPLE_SELECTOR = re.compile(r"([a-z][a-z0-9]*)?(?:#([\w-]+))?(?:\.([\w-]+))?", re.I)
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace like the in-page extractor (textContent)."""
+    return " ".join(text.split())
+
+
+class SelectolaxParser:
+    """
+    selectolax (lexbor): the fastest engine. Parses the whole document in C,
+    selectors are validated once here (lexbor has no compiled selector object).
+    """
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self.parse = LexborHTMLParser
+
+    def compile(self, spec: ExtractionSpec):
+        # fail at import on a broken selector instead of on the first search
+        empty = self.parse("<html></html>")
+        for selector in (spec.scope, spec.item, spec.name, *spec.price, *spec.remove, spec.out_of_stock):
+            if selector:
+                empty.css(selector)
+        return spec
+
+    def extract(self, html: str, spec: ExtractionSpec) -> list[dict]:
+        root = self.parse(html)
+        if spec.scope:
+            root = root.css_first(spec.scope)
+            if root is None:
+                return []
+
+        out_of_stock = set()
+        if spec.out_of_stock:
+            out_of_stock = {node.mem_id for node in root.css(spec.out_of_stock)}
+
+        records = []
+        for card in root.css(spec.item):
+            if spec.exclude_text and excluded(card.text(separator=" "), spec):
+                continue
+
+            prices = []
+            for selector in spec.price:
+                el = card.css_first(selector)
+                if el is None:
+                    continue
+                for unwanted in spec.remove:
+                    match = el.css_first(unwanted)
+                    if match is not None:
+                        match.decompose()
+                prices.append(clean_text(el.text()))
+
+            name = card.css_first(spec.name)
+            records.append({
+                "name": clean_text(name.text()) if name is not None else "",
+                "prices": prices,
+                "in_stock": card.mem_id not in out_of_stock,
+            })
+
+        return records
+
+
+class LxmlParser:
+    """
+    lxml: C parser, selectors precompiled to XPath once (cssselect).
+    """
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from cssselect import GenericTranslator
+        from lxml.etree import XPath
+        self.parse = lxml.html.document_fromstring
+        self.translator = GenericTranslator()
+        self.xpath = XPath
+
+    def css(self, selector: str, prefix: str = "descendant-or-self::"):
+        return self.xpath(self.translator.css_to_xpath(selector, prefix=prefix))
+
+    def compile(self, spec: ExtractionSpec):
+        return {
+            "scope": self.css(spec.scope) if spec.scope else None,
+            "item": self.css(spec.item),
+            # relative to a card: its descendants only
+            "name": self.css(spec.name, prefix="descendant::"),
+            "price": [self.css(s, prefix="descendant::") for s in spec.price],
+            "remove": [self.css(s, prefix="descendant::") for s in spec.remove],
+            "out_of_stock": self.css(spec.out_of_stock, prefix="self::") if spec.out_of_stock else None,
+            "spec": spec,
+        }
+
+    def extract(self, html: str, compiled: dict) -> list[dict]:
+        spec = compiled["spec"]
+        root = self.parse(html)
+        if compiled["scope"] is not None:
+            scope = compiled["scope"](root)
+            if not scope:
+                return []
+            root = scope[0]
+
+        records = []
+        for card in compiled["item"](root):
+            if spec.exclude_text and excluded(card.text_content(), spec):
+                continue
+
+            prices = []
+            for selector in compiled["price"]:
+                found = selector(card)
+                if not found:
+                    continue
+                el = found[0]
+                for unwanted in compiled["remove"]:
+                    match = unwanted(el)
+                    if match:
+                        match[0].drop_tree()
+                prices.append(clean_text(el.text_content()))
+
+            name = compiled["name"](card)
+            records.append({
+                "name": clean_text(name[0].text_content()) if name else "",
+                "prices": prices,
+                "in_stock": not (compiled["out_of_stock"] is not None and compiled["out_of_stock"](card)),
+            })
+
+        return records
+
+
+class SoupParser:
+    """
+    BeautifulSoup: the portable fallback. Selectors are precompiled with
+    soupsieve, and a simple scope selector becomes a SoupStrainer so only
+    the results container is turned into a tree.
+    """
+    name = "bs4"
+
+    def __init__(self):
+        import soupsieve
+        from bs4 import BeautifulSoup, SoupStrainer
+        self.soup = BeautifulSoup
+        self.strainer = SoupStrainer
+        self.sieve = soupsieve
+        try:
+            import lxml  # noqa: F401
+            self.builder = "lxml"
+        except ImportError:
+            self.builder = "html.parser"
+
+    def compile(self, spec: ExtractionSpec):
+        return {
+            "strainer": self.to_strainer(spec.scope) if spec.scope else None,
+            "scope": self.sieve.compile(spec.scope) if spec.scope else None,
+            "item": self.sieve.compile(spec.item),
+            "name": self.sieve.compile(spec.name),
+            "price": [self.sieve.compile(s) for s in spec.price],
+            "remove": [self.sieve.compile(s) for s in spec.remove],
+            "out_of_stock": self.sieve.compile(spec.out_of_stock) if spec.out_of_stock else None,
+            "spec": spec,
+        }
+
+    def to_strainer(self, scope: str):
+        """
+        SoupStrainer for a "tag", "#id", ".class" or "tag.class" scope;
+        anything more complex is matched after a full parse.
+        """
+        match = SIMPLE_SELECTOR.fullmatch(scope)
+        if not match:
+            return None
+
+        tag, element_id, cls = match.groups()
+        attrs = {}
+        if element_id:
+            attrs["id"] = element_id
+        if cls:
+            # one class among the element's classes
+            attrs["class"] = re.compile(rf"(?:^|\s){re.escape(cls)}(?:\s|$)")
+        return self.strainer(tag, attrs=attrs)
+
+    def extract(self, html: str, compiled: dict) -> list[dict]:
+        spec = compiled["spec"]
+        root = self.soup(html, self.builder, parse_only=compiled["strainer"])
+        if compiled["scope"] is not None:
+            root = compiled["scope"].select_one(root)
+            if root is None:
+                return []
+
+        records = []
+        for card in compiled["item"].select(root):
+            if spec.exclude_text and excluded(card.get_text(" "), spec):
+                continue
+
+            prices = []
+            for selector in compiled["price"]:
+                el = selector.select_one(card)
+                if el is None:
+                    continue
+                for unwanted in compiled["remove"]:
+                    match = unwanted.select_one(el)
+                    if match is not None:
+                        match.decompose()
+                prices.append(clean_text(el.get_text()))
+
+            name = compiled["name"].select_one(card)
+            records.append({
+                "name": clean_text(name.get_text()) if name is not None else "",
+                "prices": prices,
+                "in_stock": not (compiled["out_of_stock"] is not None and compiled["out_of_stock"].match(card)),
+            })
+
+        return records
+
+
+def excluded(card_text: str, spec: ExtractionSpec) -> bool:
+    """True when the card mentions one of spec.exclude_text (e.g. "refurbished")."""
+    card_text = card_text.lower()
+    return any(text in card_text for text in spec.exclude_text)
+
+
+ENGINES = {
+    "selectolax": SelectolaxParser,
+    "lxml": LxmlParser,
+    "bs4": SoupParser,
+}
+
+
+def load_parser(name: str = HTML_PARSER):
+    """The configured engine, or the fastest installed one for "auto"."""
+    if name != "auto":
+        return ENGINES[name]()
+
+    for engine in ENGINES.values():
+        try:
+            return engine()
+        except ImportError:
+            continue
+    raise ImportError("No HTML parser installed (selectolax, lxml or beautifulsoup4)")
+
+
+parser = load_parser()
+# compiled selectors per spec (specs are frozen, so hashable)
+compiled_specs: dict[ExtractionSpec, object] = {}
+
+
+def compile_spec(spec: ExtractionSpec):
+    """Compile a spec's selectors for the active engine (once per spec)."""
+    if spec not in compiled_specs:
+        compiled_specs[spec] = parser.compile(spec)
+    return compiled_specs[spec]
+
+
+def extract_records(html: str, spec: ExtractionSpec) -> list[dict]:
+    """
+    Extract {name, prices, in_stock} records from an HTML document, the same
+    shape the in-page extractor (EXTRACT_JS) returns.
+    """
+    return parser.extract(html, compile_spec(spec))
+
+
+def parse_products(html: str, spec: ExtractionSpec) -> list[Product]:
+    """
+    Products of an HTML document (module level so it can run in a process pool).
+    """
+    return to_products(extract_records(html, spec), spec)
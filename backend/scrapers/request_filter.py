@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+
+# resource types we never need to read product names and prices
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# analytics / ads / chat widgets: never needed, often keep the network busy
+BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "klaviyo.com",
+    "tiktok.com",
+    "pinterest.com",
+    "bing.com",
+    "clarity.ms",
+    "criteo.com",
+    "yotpo.com",
+    "judge.me",
+    "tidio.co",
+    "zendesk.com",
+)
+
+# platform CDNs the storefront themes need to render the results
+ALLOWED_SCRIPT_HOSTS = (
+    "shopify.com",
+    "shopifycdn.com",
+    "bigcommerce.com",
+)
+
+
+def host_matches(host: str, domains) -> bool:
+    """True if host is one of `domains` or a subdomain of one."""
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+def site_of(host: str) -> str:
+    """Registrable part of a host, e.g. www.watchit.ca -> watchit.ca."""
+    return ".".join(host.split(".")[-2:])
+
+
+@dataclass(frozen=True)
+class RequestFilter:
+    """
+    Which requests a Playwright scraper lets through.
+
+    Blocks heavy resource types and known trackers, and (optionally) scripts
+    served from third-party hosts, except `allowed_hosts` (e.g. the search
+    widget a retailer renders its results with).
+    """
+    blocked_types: frozenset = BLOCKED_RESOURCE_TYPES
+    blocked_hosts: tuple = BLOCKED_HOSTS
+    block_third_party_scripts: bool = True
+    allowed_hosts: tuple = field(default=ALLOWED_SCRIPT_HOSTS)
+
+    def should_block(self, resource_type: str, url: str, site: str | None) -> bool:
+        """`site` is the retailer's registrable domain (from the page's navigation)."""
+        host = urlparse(url).hostname or ""
+
+        if resource_type in self.blocked_types:
+            return True
+
+        if host_matches(host, self.blocked_hosts):
+            return True
+
+        if (
+            self.block_third_party_scripts
+            and resource_type == "script"
+            and site
+            and not host_matches(host, (site,))
+            and not host_matches(host, self.allowed_hosts)
+        ):
+            return True
+
+        return False
+
+
+# only drop heavy resources and trackers (sites built on third-party widgets)
+RESOURCES_ONLY = RequestFilter(block_third_party_scripts=False)
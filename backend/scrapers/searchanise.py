@@ -0,0 +1,50 @@
+import re
+from .utils import normalize_price
+from ..product import Product
+
+# Searchanise search API (what the storefront widget calls from the browser)
+SEARCHANISE_API_URL = "https://searchserverapi.com/getresults"
+
+# the store's public API key, as embedded in the widget's init script
+API_KEY_PATTERNS = (
+    re.compile(r"searchanise[^\"']*?[?&]a=([A-Za-z0-9]{10})"),
+    re.compile(r"""["']?api_?key["']?\s*[:=]\s*["']([A-Za-z0-9]{10})["']""", re.I),
+)
+
+
+def find_api_key(html: str) -> str | None:
+    """Find the Searchanise API key in a storefront page."""
+    for pattern in API_KEY_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    return None
+
+
+async def search(http_client, api_key: str, term: str, max_results: int = 50) -> list[Product]:
+    """
+    Query Searchanise directly and return in-stock products.
+    """
+    resp = await http_client.get(SEARCHANISE_API_URL, params={
+        "api_key": api_key,
+        "q": term,
+        "items": "true",
+        "facets": "false",
+        "startIndex": 0,
+        "maxResults": max_results,
+        "output": "json",
+    })
+    resp.raise_for_status()
+
+    products = []
+    for item in resp.json()["items"]:
+        # same as the widget's li.snize-product-in-stock
+        if int(float(item.get("quantity") or 0)) <= 0:
+            continue
+
+        price = normalize_price(str(item.get("price", "")))
+        if item.get("title") and price:
+            products.append(Product(
+                name=item["title"].strip(), price=price, url=item.get("link") or None))
+
+    return products
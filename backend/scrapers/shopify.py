@@ -0,0 +1,113 @@
+from urllib.parse import urlparse
+import httpx
+from .base_scraper import BaseScraper
+from .utils import normalize_price
+from ..product import Product
+
+
+def to_price(value) -> float | None:
+    """
+    Shopify prices: decimal strings ("129.00") in the storefront JSON,
+    integer cents (12900) in the Ajax API.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        return normalize_price(value)
+    if isinstance(value, int):
+        return value / 100
+    return float(value)
+
+
+class ShopifyScraper(BaseScraper):
+    """
+    Base scraper for Shopify storefronts.
+
+    Searches through the storefront's predictive search JSON endpoint over
+    plain HTTP (no browser), and only falls back to `scrape_page` (by
+    default the browser page scraper, see BaseScraper) when the endpoint
+    fails or answers something unexpected, or when it hits its result cap:
+    predictive search ranks by relevance, not price, so a capped answer
+    may miss the cheapest listing.
+    """
+    # the JSON path doesn't need a browser page; the page fallback takes a
+    # scheduler browser slot first (see BaseScraper.browser_page)
+    uses_browser = False
+    # products per predictive search (Shopify caps this at 10)
+    json_limit = 10
+
+    async def scrape(self, url: str, term: str) -> list[Product]:
+        try:
+            products = await self.scrape_json(url, term)
+        except (httpx.HTTPError, ValueError, KeyError, TypeError):
+            # endpoint disabled / blocked / changed: use the page scraper
+            return await self.scrape_page(url, term)
+
+        if products is None:
+            # more matches than predictive search returns: read the full results page
+            return await self.scrape_page(url, term)
+        return products
+
+    async def scrape_json(self, url: str, term: str) -> list[Product] | None:
+        """
+        Products from predictive search, or None when it returned as many as
+        json_limit (there may be more, and the cheapest may not be among them).
+        """
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        suggest_url = f"{origin}/search/suggest.json"
+
+        with self.stage("fetch"):
+            resp = await self.http_client.get(suggest_url, params={
+                "q": term,
+                "resources[type]": "product",
+                "resources[limit]": self.json_limit,
+                "resources[options][unavailable_products]": "hide",
+            })
+        resp.raise_for_status()
+
+        with self.stage("parse"):
+            items = resp.json()["resources"]["results"]["products"]
+            if len(items) >= self.json_limit:
+                return None
+
+            products = []
+            for item in items:
+                product = self.to_product(item, origin)
+                if product:
+                    products.append(product)
+
+        return products
+
+    def to_product(self, item: dict, origin: str = "") -> Product | None:
+        """
+        Map a Shopify product to a Product, or None to skip it
+        (sold out, no price, or rejected by `include`).
+        """
+        if not item.get("available", True) or not self.include(item):
+            return None
+
+        # lowest price among the variants that are in stock (sale price included)
+        prices = [
+            to_price(variant.get("price"))
+            for variant in item.get("variants") or []
+            if variant.get("available", True)
+        ]
+        prices = [p for p in prices if p]
+
+        if not prices:
+            price = to_price(item.get("price_min") or item.get("price"))
+            if not price:
+                return None
+            prices = [price]
+
+        url = item.get("url")
+        return Product(
+            name=item["title"].strip(),
+            price=min(prices),
+            url=origin + url if url else None,
+        )
+
+    def include(self, item: dict) -> bool:
+        """Retailer-specific filter on the raw Shopify product."""
+        return True
@@ -1,52 +1,64 @@
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
-from .base_scraper import BaseScraper
-from .utils import normalize_price
+import httpx
+from .base_scraper import BaseScraper, Readiness
+from .extraction import ExtractionSpec
+from . import searchanise
+from .request_filter import RequestFilter, ALLOWED_SCRIPT_HOSTS
+from ..product import Product
 
 
 class WatchItScraper(BaseScraper):
-    async def scrape(self, url: str, term: str) -> list[dict]:
-        products = []
+    search_url = "https://www.watchit.ca/pages/search-results-page?q={term}"
+    currency = "CAD"
+    # the Searchanise API path doesn't need a browser page; the page fallback
+    # takes a scheduler browser slot first (see BaseScraper.browser_page)
+    uses_browser = False
+    # store's Searchanise API key, found once from the storefront page
+    api_key: str | None = None
+    readiness = Readiness(
+        results="li.snize-product-in-stock",
+        no_results="div.search-no-results",
+    )
+    extraction = ExtractionSpec(
+        item="li.snize-product-in-stock",
+        name="span.snize-title",
+        price=("span.snize-price",),
+    )
+    # results are rendered client-side by the Searchanise widget
+    request_filter = RequestFilter(allowed_hosts=ALLOWED_SCRIPT_HOSTS + (
+        "searchanise.com",
+        "searchserverapi.com",
+        "searchserverapi1.com",
+        "kxcdn.com",
+    ))
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+    async def scrape(self, url: str, term: str) -> list[Product]:
+        try:
+            return await self.scrape_api(url, term)
+        except (httpx.HTTPError, LookupError, ValueError, TypeError):
+            # API unreachable / key not found / response changed: render the page
+            return await self.scrape_page(url, term)
 
-            # Go to the search URL
-            await page.goto(url, timeout=30000)
-
-            # Wait for either products or "no results" message
+    async def scrape_api(self, url: str, term: str) -> list[Product]:
+        """Ask Searchanise for the results the widget would render (no browser)."""
+        with self.stage("fetch"):
+            api_key = await self.get_api_key(url)
             try:
-                await page.wait_for_selector(
-                    "li.snize-product-in-stock, div.search-no-results",
-                    timeout=5000
-                )
-            except:
-                # Nothing loaded, return empty
-                await browser.close()
-                return []
-
-            content = await page.content()
-            soup = BeautifulSoup(content, "html.parser")
-
-            # --- Case 1: Products found ---
-            product_elements = soup.select("li.snize-product-in-stock")
-            for el in product_elements:
-                name_el = el.select_one("span.snize-title")
-                price_el = el.select_one("span.snize-price")
-
-                if name_el and price_el:
-                    name = name_el.get_text(strip=True)
-                    price = normalize_price(price_el.get_text(strip=True))
-                    products.append({"name": name, "price": price})
+                return await searchanise.search(self.http_client, api_key, term)
+            except httpx.HTTPStatusError as e:
+                if e.response.is_client_error:
+                    # key rotated or revoked: find it again on the next search
+                    type(self).api_key = None
+                raise
 
-            # --- Case 2: No products ---
-            if not products:
-                no_results = soup.select_one("div.search-no-results")
-                if no_results:
-                    # Explicitly return empty
-                    products = []
+    async def get_api_key(self, url: str) -> str:
+        cls = type(self)
+        if cls.api_key is None:
+            resp = await self.http_client.get(url)
+            resp.raise_for_status()
 
-            await browser.close()
+            api_key = searchanise.find_api_key(resp.text)
+            if not api_key:
+                raise LookupError("Searchanise API key not found")
+            cls.api_key = api_key
 
-        return products
+        return cls.api_key
@@ -1,67 +1,35 @@
-import requests
-from bs4 import BeautifulSoup
-from .base_scraper import BaseScraper
-from .utils import normalize_price
-
-
-class WatchoryHttpScraper(BaseScraper):
-    async def scrape(self, url: str, term: str) -> list[dict]:
-        products = []
-
+from .shopify import ShopifyScraper
+from .extraction import ExtractionSpec
+from ..product import Product
+
+
+class WatchoryHttpScraper(ShopifyScraper):
+    search_url = "https://watchory.ca/search?q={term}"
+    currency = "CAD"
+    extraction = ExtractionSpec(
+        item="li.product",
+        name="h3.card__heading a",
+        # sale price preferred, regular price fallback
+        price=(".price__sale .price-item--sale", ".price__regular .price-item"),
+        # Filter out refurbished products
+        exclude_text=("refurbished",),
+    )
+
+    def include(self, item: dict) -> bool:
+        # Filter out refurbished products
+        # predictive search names the product type "type"
+        text = " ".join([item.get("title", ""), item.get(
+            "type") or "", *(item.get("tags") or [])])
+        return "refurbished" not in text.lower()
+
+    async def scrape_page(self, url: str, term: str) -> list[Product]:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
             "Accept-Language": "en-CA,en;q=0.9",
         }
 
-        resp = requests.get(url, headers=headers, timeout=20)
+        with self.stage("fetch"):
+            resp = await self.http_client.get(url, headers=headers, timeout=20)
         resp.raise_for_status()
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-
-        product_cards = soup.select("li.product")
-
-        for card in product_cards:
-            card_text = card.get_text(" ", strip=True).lower()
-
-            # -------------------------------------------------
-            # Filter out refurbished products
-            # -------------------------------------------------
-            if "refurbished" in card_text:
-                continue
-
-            name_el = card.select_one("h3.card__heading a")
-            if not name_el:
-                continue
-
-            name = name_el.get_text(strip=True)
-
-            # -------------------------------------------------
-            # Price extraction (lowest available price)
-            # -------------------------------------------------
-            price = None
-
-            # Sale price (preferred)
-            sale_price_el = card.select_one(
-                ".price__sale .price-item--sale"
-            )
-            if sale_price_el:
-                price = normalize_price(sale_price_el.get_text(strip=True))
-            else:
-                # Regular price fallback
-                regular_price_el = card.select_one(
-                    ".price__regular .price-item"
-                )
-                if regular_price_el:
-                    price = normalize_price(
-                        regular_price_el.get_text(strip=True)
-                    )
-
-            if price is None:
-                continue
-
-            products.append({
-                "name": name,
-                "price": price,
-            })
-
-        return products
+        return await self.parse_html(resp.text, self.extraction)
@@ -0,0 +1,299 @@
+import asyncio
+import heapq
+import time
+from operator import attrgetter
+from fastapi import HTTPException
+from backend.scrapers import DOMAIN_SCRAPER
+from backend.relevance import CompiledQuery, cheapest, extract_model_tokens, top_results
+from backend.cache import cache_key
+from backend.scheduler import SchedulerFull
+from backend.product import Product
+from backend import metrics, tracing
+
+
+# ============================================================
+# Single retailer
+# ============================================================
+
+def build_result(term: str, products: list[Product], top_k: int | None = None) -> dict:
+    """
+    Filter scraped products for the term and pick the starting price.
+
+    Only the top_k best matches are returned (all of them when None, none
+    with 0: the "min price only" mode, which copies and sorts nothing), but
+    the starting price is the lowest among every match.
+    """
+    # score once, keep the unrelated ones out
+    matches = CompiledQuery(term).matches(products)
+
+    if matches:
+        # Find the product with the minimum price
+        starting_from = cheapest(matches).price
+        if top_k == 0:
+            return {"matches": len(matches), "starting_from": starting_from}
+        return {
+            "filtered_products": top_results(matches, top_k),
+            "matches": len(matches),
+            "starting_from": starting_from,
+        }
+
+    # If nothing matched, return all products (the cheapest ones first when capped)
+    if top_k == 0:
+        return {"starting_from": min(products, key=attrgetter("price")).price}
+    if top_k is not None:
+        all_products = heapq.nsmallest(top_k, products, key=attrgetter("price"))
+    else:
+        all_products = products
+    min_product = min(products, key=attrgetter("price"))
+    return {"all_products": all_products, "starting_from": min_product.price}
+
+
+async def search_retailer(state, domain: str, term: str) -> dict:
+    """
+    Scrape one retailer's search page for the term and build its result.
+
+    `state` is the app state holding the shared browser pool, HTTP client,
+    CPU executor, result cache, in-flight scrapes and refresher. The
+    result's "cache" field tells whether the products came from the cache
+    ("hit"), from a stale cache entry being refreshed in the background
+    ("stale"), a fresh scrape ("miss") or an identical scrape that was
+    already running ("coalesced").
+    The search URL is always built from the term (build_search_url): the
+    cache, in-flight scrapes and catalog are keyed on the term, so they must
+    never hold products read from some other page.
+    Raises HTTPException (500 on scraper failure, 404 when nothing was found).
+    """
+    # Lookup scraper class for this domain
+    scraper_class = DOMAIN_SCRAPER.get(domain)
+    if not scraper_class:
+        # If no scraper exists for this domain, return 400 error
+        raise HTTPException(
+            status_code=400, detail=f"No scraper available for domain '{domain}'")
+
+    state.refresher.record(domain, term)
+
+    # serve repeated searches from the cache (confirmed empty results are cached too)
+    with tracing.span("cache", domain=domain):
+        entry = await state.cache.get(cache_key(domain, term))
+
+    timings = {}
+
+    if entry is None:
+        (products, timings), coalesced = await fetch_products(state, domain, term)
+        cache_status = "coalesced" if coalesced else "miss"
+    elif state.cache.is_fresh(entry):
+        products, cache_status = entry.products, "hit"
+    else:
+        # stale-while-revalidate: answer now, refresh in the background
+        products, cache_status = entry.products, "stale"
+        state.refresher.refresh_soon(domain, term)
+
+    metrics.observe_cache(domain, cache_status)
+
+    if not products:
+        # If scraper returns empty list, return 404
+        raise HTTPException(status_code=404, detail="No products found",
+                            headers={"X-Cache": cache_status.upper()})
+
+    # scoring is CPU-bound: keep it off the event loop
+    started = time.perf_counter()
+    with tracing.span("relevance", domain=domain, cache=cache_status, products=len(products)):
+        result = await state.executor.run(
+            build_result, term, products, state.result_top_k)
+    timings = {**timings, "relevance": time.perf_counter() - started}
+    metrics.observe_search(
+        domain, len(products), result.get("matches", 0), timings["relevance"])
+
+    return {
+        **result,
+        "cache": cache_status,
+        # seconds per stage, e.g. queue / navigation / readiness / parse / relevance
+        "timings": {stage: round(t, 4) for stage, t in timings.items()},
+    }
+
+
+async def fetch_products(state, domain: str, term: str) -> tuple[tuple[list[Product], dict], bool]:
+    """
+    Scrape a retailer's search page for the term and store the products in
+    the cache and the catalog.
+
+    Identical scrapes already running (same retailer and normalized term,
+    like the cache) are joined instead of started again; returns
+    ((products, timings), coalesced). Failed scrapes raise and are not cached.
+    """
+    key = cache_key(domain, term)
+    url = DOMAIN_SCRAPER[domain].build_search_url(term)
+
+    async def scrape_and_cache():
+        products, timings = await scrape(state, domain, url, term)
+        await state.cache.set(key, products)
+        # keep every scraped listing in the catalog too
+        await state.catalog.upsert(domain, term, products)
+        return products, timings
+
+    return await state.scrapes.do(key, scrape_and_cache)
+
+
+async def refresh_retailer(state, domain: str, term: str):
+    """Re-scrape a retailer's search page for a term into the cache (background refresh)."""
+    await fetch_products(state, domain, term)
+
+
+async def scrape(state, domain: str, url: str, term: str) -> tuple[list[Product], dict]:
+    """
+    Run a scraper with the shared browser pool and HTTP client, once the
+    scheduler grants it a slot (503 with Retry-After when it's overloaded).
+    Returns the products and the time spent in each stage.
+    """
+    scraper_class = DOMAIN_SCRAPER[domain]
+    scraper = scraper_class(
+        browser_pool=state.browser_pool,
+        http_client=state.http_client,
+        executor=state.executor,
+        # HTTP-first scrapers only hold a browser slot if they fall back to a page
+        browser_slot=None if scraper_class.uses_browser else state.scheduler.browser_slot,
+    )
+
+    queued = time.perf_counter()
+    try:
+        async with state.scheduler.slot(domain, scraper_class.uses_browser):
+            scraper.timings["queue"] = time.perf_counter() - queued
+            # Call the scraper to get products
+            with tracing.span("scrape", domain=domain, scraper=scraper_class.__name__,
+                              queue_seconds=round(scraper.timings["queue"], 4)):
+                products = await scraper.scrape(url, term)
+            for product in products:
+                product.retailer = domain
+                product.currency = scraper_class.currency
+            metrics.observe_scrape(domain, scraper.timings, len(products))
+            return products, scraper.timings
+    except SchedulerFull as e:
+        metrics.SCRAPES.labels(domain, "rejected").inc()
+        raise HTTPException(
+            status_code=503,
+            detail="Too many searches in progress, please try again shortly",
+            headers={"Retry-After": str(e.retry_after)})
+    except Exception as e:
+        # Catch any scraping errors and return 500
+        metrics.observe_failure(domain, e)
+        raise HTTPException(
+            status_code=500, detail=f"Scraping failed: {str(e)}")
+
+
+# ============================================================
+# Fan-out across retailers
+# ============================================================
+
+async def search_retailer_with_timeout(state, domain: str, term: str, timeout: float) -> dict:
+    """
+    Search one retailer by domain, never raising.
+
+    Errors are reported in the result as a status code and detail, so one
+    failing or slow retailer doesn't affect the others.
+    """
+    try:
+        result = await asyncio.wait_for(
+            search_retailer(state, domain, term), timeout=timeout)
+    except asyncio.TimeoutError:
+        metrics.TIMEOUTS.labels(domain).inc()
+        return {"domain": domain, "status": 504, "detail": "Scraping timed out"}
+    except HTTPException as e:
+        result = {"domain": domain, "status": e.status_code, "detail": e.detail}
+        if e.headers and "X-Cache" in e.headers:
+            result["cache"] = e.headers["X-Cache"].lower()
+        return result
+
+    return {"domain": domain, "status": 200, **result}
+
+
+async def search_retailers(state, domains: list[str], term: str, timeout: float) -> list[dict]:
+    """
+    Search several retailers concurrently, each with its own timeout.
+    Results are returned in the order of `domains`.
+    """
+    return await asyncio.gather(*(
+        search_retailer_with_timeout(state, domain, term, timeout)
+        for domain in domains
+    ))
+
+
+async def stream_retailers(state, domains: list[str], term: str, timeout: float):
+    """
+    Search several retailers concurrently and yield each result as soon as
+    its scraper finishes, followed by a final summary event.
+    """
+    started = time.monotonic()
+    tasks = [
+        asyncio.create_task(
+            search_retailer_with_timeout(state, domain, term, timeout))
+        for domain in domains
+    ]
+    results = []
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            results.append(result)
+            yield {"event": "result", **result}
+    finally:
+        # the client went away mid-stream: stop the remaining scrapes
+        for task in tasks:
+            task.cancel()
+
+    yield {"event": "summary", **summarize(results), "elapsed": round(time.monotonic() - started, 3)}
+
+
+def summarize(results: list[dict]) -> dict:
+    """
+    Overall outcome of a multi-retailer search: how many retailers answered
+    and where the cheapest starting price is.
+    """
+    found = [r for r in results if r["status"] == 200]
+    cheapest = min(found, key=lambda r: r["starting_from"], default=None)
+
+    return {
+        "retailers": len(results),
+        "found": len(found),
+        "starting_from": cheapest["starting_from"] if cheapest else None,
+        "cheapest_domain": cheapest["domain"] if cheapest else None,
+    }
+
+
+# ============================================================
+# Catalog
+# ============================================================
+
+async def cheapest_in_catalog(state, term: str, timeout: float) -> dict:
+    """
+    Cheapest listing of a model across retailers, answered from the catalog
+    index. Only retailers whose catalog data for the term is stale (or
+    missing) are scraped first.
+    """
+    if not extract_model_tokens(term):
+        raise HTTPException(
+            status_code=400, detail="The term needs a model number, e.g. GA-2100")
+
+    stale = await state.catalog.stale_retailers(list(DOMAIN_SCRAPER), term)
+    scraped = []
+    if stale:
+        # scraped products land in the catalog (see fetch_products)
+        await search_retailers(state, stale, term, timeout)
+        # failed or timed out scrapes left their retailer stale
+        failed = set(await state.catalog.stale_retailers(stale, term))
+        scraped = [r for r in stale if r not in failed]
+
+    products = await state.catalog.find(term)
+    matches = [r for _, r in CompiledQuery(term).matches(products)]
+
+    # cheapest match per retailer
+    by_retailer = {}
+    for product in sorted(matches, key=attrgetter("price")):
+        by_retailer.setdefault(product.retailer, product)
+
+    return {
+        "term": term,
+        "cheapest": min(matches, key=attrgetter("price"), default=None),
+        "retailers": by_retailer,
+        "matches": len(matches),
+        "scraped": scraped,
+    }
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Deduplicate identical concurrent calls.
+
+    The first caller for a key (the leader) starts the work; callers that
+    arrive while it is still running (followers) await the same task instead
+    of starting their own. The work runs in its own task, so a caller timing
+    out or disconnecting doesn't cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        # number of calls that started work / joined an in-flight call
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]) -> tuple[object, bool]:
+        """
+        Run `fn()` once per in-flight key.
+        Returns (result, coalesced) where `coalesced` is True for followers.
+        """
+        task = self._calls.get(key)
+        coalesced = task is not None
+
+        if coalesced:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+
+        return await asyncio.shield(task), coalesced
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> dict:
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # mark the exception as retrieved in case every caller gave up waiting
+        if not task.cancelled():
+            task.exception()
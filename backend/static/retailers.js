@@ -1,6 +1,7 @@
 export const retailers = [
     {
         id: 'watch-it',
+        domain: 'watchit.ca',
         name: 'Watch It!',
         url: 'https://www.watchit.ca/',
         buildSearchUrl: (term) =>
@@ -10,6 +11,7 @@ export const retailers = [
     },
     {
         id: 'watchory',
+        domain: 'watchory.ca',
         name: 'Watchory',
         url: 'https://watchory.ca/',
         buildSearchUrl: (term) =>
@@ -17,6 +19,7 @@ export const retailers = [
     },
     {
         id: 'big-time-watches',
+        domain: 'bigtimewatches.com',
         name: 'Big Time Watches',
         url: 'https://bigtimewatches.com/',
         buildSearchUrl: (term) =>
@@ -24,6 +27,7 @@ export const retailers = [
     },
     {
         id: 'city-watches',
+        domain: 'citywatches.ca',
         name: 'City Watches',
         url: 'https://www.citywatches.ca/',
         buildSearchUrl: (term) =>
@@ -31,6 +35,7 @@ export const retailers = [
     },
     {
         id: 'ebay',
+        domain: 'ebay.ca',
         name: 'eBay',
         url: 'https://www.ebay.ca/',
         buildSearchUrl: (term) =>
@@ -38,6 +43,7 @@ export const retailers = [
     },
     {
         id: 'bijoux-eclore',
+        domain: 'bijouxeclore.com',
         name: 'Bijoux Eclore',
         url: 'https://www.bijouxeclore.com/',
         buildSearchUrl: (term) =>
@@ -47,6 +53,7 @@ export const retailers = [
     },
     {
         id: 'kavar-jewellers',
+        domain: 'kavarjewellers.ca',
         name: 'Kavar Jewellers',
         url: 'https://www.kavarjewellers.ca/',
         buildSearchUrl: (term) =>
@@ -56,6 +63,7 @@ export const retailers = [
     },
     {
         id: 'peoples-jewellers',
+        domain: 'peoplesjewellers.com',
         name: 'Peoples Jewellers',
         url: 'https://www.peoplesjewellers.com/',
         buildSearchUrl: (term) =>
@@ -65,6 +73,7 @@ export const retailers = [
     },
     {
         id: 'creation-watches',
+        domain: 'creationwatches.com',
         name: 'Creation Watches',
         url: 'https://www.creationwatches.com/',
         buildSearchUrl: (term) =>
@@ -74,6 +83,7 @@ export const retailers = [
     },
     {
         id: 'canada-watch-house',
+        domain: 'canadawatchhouse.ca',
         name: 'Canada Watch House',
         url: 'https://canadawatchhouse.ca/',
         buildSearchUrl: (term) =>
@@ -81,6 +91,7 @@ export const retailers = [
     },
     {
         id: 'assaleh',
+        domain: 'assaleh.ca',
         name: 'Assaleh',
         url: 'https://assaleh.ca/',
         buildSearchUrl: (term) =>
@@ -88,6 +99,7 @@ export const retailers = [
     },
     {
         id: 'gem-bijou',
+        domain: 'gembijou.com',
         name: 'Gem Bijou',
         url: 'https://gembijou.com/',
         buildSearchUrl: (term) =>
@@ -18,7 +18,7 @@ const state = {
     displayedRateLimitError: false,
 };
 
-const BACKEND_ENDPOINT = '/extract-price';
+const BACKEND_ENDPOINT = '/search/stream';
 
 // Load models.json
 fetch('models.json')
@@ -87,18 +87,8 @@ DOM.form.addEventListener('submit', async (e) => {
     resetRetailersList();
     showLoader();
 
-    const fetchPromises = retailers.map((retailer) => {
-        const retailerLinkEl = document.getElementById(retailer.id);
-        if (!retailerLinkEl) return Promise.resolve();
-
-        return fetchRetailerPrice({
-            retailer,
-            searchTerm,
-            retailerLinkEl,
-        });
-    });
-
-    await Promise.allSettled(fetchPromises);
+    // one request for every retailer, the server fans out
+    await fetchAllPrices(searchTerm);
 
     hideLoader();
 
@@ -125,49 +115,85 @@ DOM.openAllBtn.addEventListener('click', () => {
 
 // Functions
 
-async function fetchRetailerPrice({ retailer, searchTerm, retailerLinkEl }) {
-    const searchUrl = retailer.buildSearchUrl(searchTerm);
-    retailerLinkEl.href = searchUrl;
+async function fetchAllPrices(searchTerm) {
+    // point every card at the retailer's own search page
+    const cards = {};
+    retailers.forEach((retailer) => {
+        const retailerLinkEl = document.getElementById(retailer.id);
+        if (!retailerLinkEl) return;
+
+        retailerLinkEl.href = retailer.buildSearchUrl(searchTerm);
+        cards[retailer.domain] = { retailer, retailerLinkEl };
+    });
 
     try {
         const res = await fetch(BACKEND_ENDPOINT, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify({
-                url: searchUrl,
                 term: searchTerm,
+                retailers: Object.keys(cards),
             }),
         });
 
         if (!res.ok) {
-            handleFetchError(res, retailerLinkEl);
-            state.priceMap[retailer.id] = null;
+            handleFetchError(res);
             return;
         }
 
-        const data = await res.json();
+        // newline-delimited JSON: one event per retailer as it finishes
+        await readEvents(res, (event) => {
+            if (event.event !== 'result') return;
 
-        if (typeof data?.starting_from === 'number') {
-            state.priceMap[retailer.id] = data.starting_from;
-            retailerLinkEl.textContent = `From $${data.starting_from}`;
-            retailerLinkEl.style.color = '#00ffff';
-        } else {
-            state.priceMap[retailer.id] = null;
-        }
+            const card = cards[event.domain];
+            if (!card) return;
+
+            applyRetailerResult(card, event);
+            updateListOrder();
+        });
     } catch (err) {
-        console.error('Fetch error for', retailer.id, err);
-        state.priceMap[retailer.id] = null;
+        console.error('Search error', err);
     }
+}
 
-    updateListOrder();
+async function readEvents(res, onEvent) {
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        // keep the trailing partial line for the next chunk
+        buffer = lines.pop();
+
+        lines.filter((line) => line.trim()).forEach((line) => {
+            onEvent(JSON.parse(line));
+        });
+    }
+
+    if (buffer.trim()) onEvent(JSON.parse(buffer));
 }
 
-function handleFetchError(res, retailerLinkEl) {
-    if (res.status === 404) {
-        retailerLinkEl.textContent = 'No in-stock results';
+function applyRetailerResult({ retailer, retailerLinkEl }, result) {
+    if (result.status === 200 && typeof result.starting_from === 'number') {
+        state.priceMap[retailer.id] = result.starting_from;
+        retailerLinkEl.textContent = `From $${result.starting_from}`;
+        retailerLinkEl.style.color = '#00ffff';
         return;
     }
 
+    state.priceMap[retailer.id] = null;
+
+    if (result.status === 404) {
+        retailerLinkEl.textContent = 'No in-stock results';
+    }
+}
+
+function handleFetchError(res) {
     if (res.status === 429 && !state.displayedRateLimitError) {
         Toastify({
             text: 'Too many requests! Please wait 1 minute before trying again.',
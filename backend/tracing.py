@@ -0,0 +1,85 @@
+"""
+OpenTelemetry tracing (optional).
+
+Each /extract-price request becomes a trace: validation, dispatch (cache,
+scheduler queue, scrape) and every scraper stage (BaseScraper.stage: fetch /
+navigation / readiness / extraction / parse), then relevance, each with the
+retailer as an attribute.
+
+Spans are exported to an OTLP collector ("otlp", endpoint from the standard
+OTEL_EXPORTER_OTLP_* variables) or appended as JSON lines to a file ("file").
+opentelemetry-sdk is required (opentelemetry-exporter-otlp-proto-http for
+"otlp"); without it, or with no exporter configured, span() does nothing.
+"""
+from contextlib import contextmanager, nullcontext
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+SERVICE_NAME = "watch-scraper"
+
+# set by setup(), None while tracing is off
+_tracer = None
+_provider = None
+_file = None
+
+
+def setup(exporter: str, path: str | None = None):
+    """Start exporting spans: exporter is "otlp", "file" (JSON lines to path) or "" (off)."""
+    global _tracer, _provider, _file
+    if not exporter:
+        return
+    if trace is None:
+        raise RuntimeError(
+            "Tracing needs opentelemetry-sdk: pip install opentelemetry-sdk opentelemetry-exporter-otlp-proto-http")
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        span_exporter = OTLPSpanExporter()
+    elif exporter == "file":
+        _file = open(path, "a", encoding="utf-8")
+        span_exporter = ConsoleSpanExporter(
+            out=_file, formatter=lambda span: span.to_json(indent=None) + "\n")
+    else:
+        raise ValueError(f"Unknown tracing exporter '{exporter}'")
+
+    _provider = TracerProvider(resource=Resource.create({"service.name": SERVICE_NAME}))
+    _provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    _tracer = _provider.get_tracer(__name__)
+
+
+def shutdown():
+    """Flush pending spans and stop exporting."""
+    global _tracer, _provider, _file
+    if _provider is not None:
+        _provider.shutdown()
+    if _file is not None:
+        _file.close()
+    _tracer = _provider = _file = None
+
+
+def span(name: str, **attributes):
+    """
+    Context manager timing a block as a child of the current span:
+
+        with tracing.span("relevance", domain=domain):
+            ...
+    """
+    if _tracer is None:
+        return nullcontext()
+    return _span(name, attributes)
+
+
+@contextmanager
+def _span(name: str, attributes: dict):
+    # exceptions are recorded on the span (and re-raised) by start_as_current_span
+    with _tracer.start_as_current_span(name, attributes={
+        k: v for k, v in attributes.items() if v is not None
+    }) as current:
+        yield current
@@ -0,0 +1,57 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from backend.profiling import profiled_call, worker_sessions
+
+
+class CpuExecutor:
+    """
+    Runs CPU-bound work (HTML parsing, relevance scoring) off the event loop,
+    so one big results page doesn't stall every other request.
+
+    - kind: "thread" (default), "process" (parsing scales across cores, the
+      work and its arguments must be picklable) or "inline" (on the loop)
+    - workers: pool size (defaults to the number of cores)
+    """
+
+    def __init__(self, kind: str = "thread", workers: int | None = None):
+        if kind not in ("thread", "process", "inline"):
+            raise ValueError(f"Unknown CPU executor '{kind}'")
+
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.pool: Executor | None = None
+
+    def start(self):
+        if self.kind == "thread":
+            self.pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="cpu")
+        elif self.kind == "process":
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def stop(self):
+        if self.pool:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in the pool and wait for its result."""
+        if self.pool is None:
+            return fn(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+
+        # the request is being profiled: profile the work in the worker too
+        sessions = worker_sessions.get()
+        if sessions is not None:
+            result, session = await loop.run_in_executor(
+                self.pool, partial(profiled_call, fn, *args, **kwargs))
+            sessions.append(session)
+            return result
+
+        return await loop.run_in_executor(self.pool, partial(fn, *args, **kwargs))
+
+
+# used when no executor is given (e.g. a scraper run on its own)
+INLINE = CpuExecutor("inline")